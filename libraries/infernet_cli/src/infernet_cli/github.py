@@ -1,6 +1,51 @@
-from typing import Any
+from functools import lru_cache
+from typing import Any, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+
+# Maximum number of concurrent requests to GitHub, sized to match the session's
+# connection pool so that parallel fetches reuse pooled connections
+MAX_CONCURRENT_REQUESTS = 8
+
+# Chunk size when streaming files to disk
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Shared session, reuses TCP / TLS connections across requests
+session = requests.Session()
+session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=MAX_CONCURRENT_REQUESTS,
+        pool_maxsize=MAX_CONCURRENT_REQUESTS,
+    ),
+)
+
+
+@lru_cache(maxsize=128)
+def _list_contents(
+    owner: str, repo: str, path: str, branch: str
+) -> tuple[tuple[str, str], ...]:
+    """List the contents of a GitHub repo path.
+
+    Results are cached for the lifetime of the process, so repeated listings of the
+    same path within a single CLI invocation don't hit the GitHub API again.
+
+    Args:
+        owner (str): The owner of the repository.
+        repo (str): The repository name.
+        path (str): The path to list contents from.
+        branch (str): The branch to list contents from.
+
+    Returns:
+        tuple[tuple[str, str], ...]: (name, type) pairs of the path's contents.
+    """
+
+    url = f"https://api.github.com/repos/{owner}/{repo}/contents/{path}?ref={branch}"
+
+    response = session.get(url)
+    response.raise_for_status()
+    return tuple((item["name"], item["type"]) for item in response.json())
 
 
 def github_list_files(
@@ -19,27 +64,34 @@ def github_list_files(
         list[str]: A list of file names.
     """
 
-    url = f"https://api.github.com/repos/{owner}/{repo}/contents/{path}?ref={branch}"
-    files = []
-
-    response = requests.get(url)
-    response.raise_for_status()
-    data = response.json()
-    files.extend([file["name"] for file in data if file["type"] == type])
-    return files
+    return [
+        name
+        for name, _type in _list_contents(owner, repo, path, branch)
+        if _type == type
+    ]
 
 
-def github_pull_file(owner: str, repo: str, path: str, branch: str = "main") -> Any:
+def github_pull_file(
+    owner: str,
+    repo: str,
+    path: str,
+    branch: str = "main",
+    dest_path: Optional[str] = None,
+) -> Any:
     """Retrieve a file's contents from Github
 
+    If a destination path is provided, the file is streamed to disk in chunks instead
+    of being held in memory.
+
     Args:
         owner (str): The owner of the repository.
         repo (str): The repository name.
         path (str): The path to the file.
         branch (str): The branch to pull the file from. Defaults to "main".
+        dest_path (Optional[str]): The path to write the file to. Defaults to None.
 
     Returns:
-        Any: The file's contents.
+        Any: The file's contents, or the destination path if one was provided.
     """
 
     api_url = (
@@ -50,7 +102,15 @@ def github_pull_file(owner: str, repo: str, path: str, branch: str = "main") ->
     }
 
     try:
-        response = requests.get(api_url, headers=headers)
+        if dest_path is not None:
+            with session.get(api_url, headers=headers, stream=True) as response:
+                response.raise_for_status()
+                with open(dest_path, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                        f.write(chunk)
+            return dest_path
+
+        response = session.get(api_url, headers=headers)
         response.raise_for_status()
         if path.endswith(".json"):
             return response.json()
@@ -1,12 +1,19 @@
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Optional, cast
 
 import click
 import requests
 
-from infernet_cli.github import github_list_files, github_pull_file
+from infernet_cli.github import (
+    MAX_CONCURRENT_REQUESTS,
+    github_list_files,
+    github_pull_file,
+)
 from infernet_cli.recipe import InfernetRecipe, fill_in_recipe
 
 
@@ -29,15 +36,16 @@ def get_compatible_node_versions() -> list[str]:
     )
 
 
-def get_docker_image_tags(owner: str, repo: str) -> list[str]:
-    """Get all tags for a Docker image repository.
+@lru_cache(maxsize=128)
+def _get_docker_image_tags(owner: str, repo: str) -> tuple[str, ...]:
+    """Get all tags for a Docker image repository, cached for the process lifetime.
 
     Args:
         owner (str): The owner of the repository.
         repo (str): The repository name.
 
     Returns:
-        list[str]: A list of tags.
+        tuple[str, ...]: The tags.
     """
     url = f"https://hub.docker.com/v2/repositories/{owner}/{repo}/tags/"
     tags = []
@@ -49,7 +57,20 @@ def get_docker_image_tags(owner: str, repo: str) -> list[str]:
         tags.extend([tag["name"] for tag in data["results"]])
         url = data["next"]  # If there's a next page, continue
 
-    return tags
+    return tuple(tags)
+
+
+def get_docker_image_tags(owner: str, repo: str) -> list[str]:
+    """Get all tags for a Docker image repository.
+
+    Args:
+        owner (str): The owner of the repository.
+        repo (str): The repository name.
+
+    Returns:
+        list[str]: A list of tags.
+    """
+    return list(_get_docker_image_tags(owner, repo))
 
 
 def can_overwrite_file(file: str, dir: str, force: bool) -> None:
@@ -93,7 +114,7 @@ def get_configs(
 
     1. Touches target directory
     2. Fetches available node tags to validate version
-    3. Fetches configuration files
+    3. Fetches configuration files (concurrently)
     4. Keeps the correct docker-compose file based on GPU support
     5. Fills in the recipe with input values
     6. Writes the configuration files
@@ -144,31 +165,55 @@ def get_configs(
     else:
         deploy_files.remove("docker-compose-gpu.yaml")
 
-    for file in deploy_files:
-        contents = github_pull_file(
-            "ritual-net",
-            "infernet-recipes",
-            f"node/{chain}/{version}/{file}",
-        )
-
-        # Special handling for config file to get inputs
-        if file == "config.json":
-            contents = fill_in_recipe(cast(InfernetRecipe, contents), inputs, skip)
-
-        can_overwrite_file(file, dir, force)
-
-        # Special handling of docker-compose file
-        if file.startswith("docker-compose"):
-            path = os.path.join(dir, "docker-compose.yaml")
-        else:
-            path = os.path.join(dir, file)
+    # Fetch all files concurrently, results are in the same order as deploy_files.
+    # Non-JSON files are streamed to a temporary file next to their destination, and
+    # only moved into place once overwriting is confirmed.
+    downloads = {
+        file: os.path.join(dir, f".{file}.download")
+        for file in deploy_files
+        if not file.endswith(".json")
+    }
+    try:
+        # Leaving the executor waits for every fetch, so no download is still being
+        # written when a failed fetch cleans up the others
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+            all_contents = list(
+                executor.map(
+                    lambda file: github_pull_file(
+                        "ritual-net",
+                        "infernet-recipes",
+                        f"node/{chain}/{version}/{file}",
+                        dest_path=downloads.get(file),
+                    ),
+                    deploy_files,
+                )
+            )
+
+        for file, contents in zip(deploy_files, all_contents):
+            # Special handling for config file to get inputs
+            if file == "config.json":
+                contents = fill_in_recipe(cast(InfernetRecipe, contents), inputs, skip)
+
+            can_overwrite_file(file, dir, force)
+
+            # Special handling of docker-compose file
+            if file.startswith("docker-compose"):
+                path = os.path.join(dir, "docker-compose.yaml")
+            else:
+                path = os.path.join(dir, file)
 
-        # Write the file
-        with open(path, "w") as f:
+            # Write the file, or move the downloaded file into place
             if file.endswith(".json"):
-                f.write(json.dumps(contents, indent=4))
+                with open(path, "w") as f:
+                    f.write(json.dumps(contents, indent=4))
             else:
-                f.write(contents)
+                os.replace(downloads[file], path)
+    finally:
+        # Clean up downloads that were not moved into place, i.e. on abort or when a
+        # fetch failed
+        for download in downloads.values():
+            with suppress(FileNotFoundError):
+                os.remove(download)
 
     click.echo(
         f"\nStored base configurations to '{os.path.abspath(dir)}'."
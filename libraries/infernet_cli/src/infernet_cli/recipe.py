@@ -1,5 +1,6 @@
 import json
 from copy import deepcopy
+from functools import lru_cache
 from typing import Any, Optional, TypedDict
 
 import click
@@ -43,6 +44,24 @@ class InfernetRecipe(TypedDict):
     inputs: NotRequired[list[RecipeInputs]]
 
 
+@lru_cache(maxsize=512)
+def _parse_path(path: str) -> tuple[tuple[str, ...], Optional[str]]:
+    """Parse a recipe input path into its keys and mid-string substitution
+
+    Paths are dot-separated keys into the configuration, optionally followed by a
+    `#` and the name of a `${...}` placeholder to substitute, e.g. `command#ARG`.
+
+    Args:
+        path (str): The recipe input path
+
+    Returns:
+        tuple[tuple[str, ...], Optional[str]]: The keys to traverse, and the
+            placeholder name if the path is a mid-string substitution
+    """
+    keys, _, pound_substr = path.partition("#")
+    return tuple(keys.split(".")), pound_substr or None
+
+
 def fill_in_recipe(
     recipe: InfernetRecipe, inputs: Optional[dict[str, Any]] = None, skip: bool = False
 ) -> Any:
@@ -95,13 +114,7 @@ def fill_in_recipe(
                 continue
 
         # Handle mid-string substitutions with # notation
-        pound_index = var["path"].find("#")
-        pound_substr = None
-        if pound_index != -1:
-            pound_substr = var["path"][pound_index + 1 :]
-            keys = var["path"][:pound_index].split(".")
-        else:
-            keys = var["path"].split(".")
+        keys, pound_substr = _parse_path(var["path"])
 
         # Traverse the configuration path
         ptr = config
@@ -111,8 +124,13 @@ def fill_in_recipe(
         # Store value in the configuration
         if not pound_substr:
             ptr[keys[-1]] = value  # type: ignore
-        else:
+        elif isinstance(ptr[keys[-1]], str):  # type: ignore
             # make the mid-string substitution
+            ptr[keys[-1]] = ptr[keys[-1]].replace(  # type: ignore
+                "${" + pound_substr + "}", str(value)
+            )
+        else:
+            # make the mid-string substitution within a nested object
             string = json.dumps(ptr[keys[-1]])  # type: ignore
             string = string.replace("${" + pound_substr + "}", str(value))
             ptr[keys[-1]] = json.loads(string)  # type: ignore
@@ -1,11 +1,16 @@
 import json
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Optional, cast
 
 import click
 
-from infernet_cli.github import github_list_files, github_pull_file
+from infernet_cli.github import (
+    MAX_CONCURRENT_REQUESTS,
+    github_list_files,
+    github_pull_file,
+)
 from infernet_cli.recipe import InfernetRecipe, fill_in_recipe
 
 
@@ -28,14 +33,6 @@ def add_service_container(
         inputs (Optional[dict[str, Any]]): The inputs to fill in the recipe.
         skip (bool): Whether to skip optional inputs.
     """
-    # Pull all recipe IDs
-    recipe_ids = github_list_files(
-        "ritual-net",
-        "infernet-recipes",
-        "services",
-        type="dir",
-    )
-
     if not recipe_id:
         # Take entire object from stdin - stop at EOF
         click.echo("Enter service configuration JSON, followed by EOF:")
@@ -48,15 +45,36 @@ def add_service_container(
             recipe_id.split(":") if ":" in recipe_id else (recipe_id, None)
         )
 
-        if service not in recipe_ids:
+        # Pull all recipe IDs, the service's versions and, if the version is known
+        # upfront, the recipe file concurrently
+        recipe_future: Optional[Future[Any]] = None
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+            recipe_ids_future = executor.submit(
+                github_list_files,
+                "ritual-net",
+                "infernet-recipes",
+                "services",
+                type="dir",
+            )
+            versions_future = executor.submit(
+                github_list_files,
+                "ritual-net",
+                "infernet-recipes",
+                f"services/{service}",
+                type="dir",
+            )
+            if version:
+                recipe_future = executor.submit(
+                    github_pull_file,
+                    "ritual-net",
+                    "infernet-recipes",
+                    f"services/{service}/{version}/recipe.json",
+                )
+
+        if service not in recipe_ids_future.result():
             raise click.ClickException(f"Service '{recipe_id}' not found.")
 
-        versions = github_list_files(
-            "ritual-net",
-            "infernet-recipes",
-            f"services/{service}",
-            type="dir",
-        )
+        versions = versions_future.result()
 
         if version and version not in versions:
             raise click.ClickException(
@@ -67,13 +85,17 @@ def add_service_container(
             version = sorted(versions)[-1]
             click.echo(f"Version not provided. Using latest version '{version}'.")
 
-        # Pull the recipe file
+        # Pull the recipe file, unless already fetched
         recipe = cast(
             InfernetRecipe,
-            github_pull_file(
-                "ritual-net",
-                "infernet-recipes",
-                f"services/{service}/{version}/recipe.json",
+            (
+                recipe_future.result()
+                if recipe_future
+                else github_pull_file(
+                    "ritual-net",
+                    "infernet-recipes",
+                    f"services/{service}/{version}/recipe.json",
+                )
             ),
         )
 
@@ -92,20 +114,19 @@ def add_service_container(
             f"Error decoding config.json: {e}. \nTry running `infernet-cli config`."
         )
 
+    # Index services by ID, preserving their order
+    services = {service["id"]: service for service in full_config["containers"]}
+
     # Ensure service ID does not already exist
-    if any(service["id"] == config["id"] for service in full_config["containers"]):
+    if config["id"] in services:
         click.confirm(
             f"Service '{config['id']}' already exists. Overwrite?", abort=True
         )
-
-        full_config["containers"] = [
-            service
-            for service in full_config["containers"]
-            if service["id"] != config["id"]
-        ]
+        del services[config["id"]]
 
     # Append service and rewrite config.json
-    full_config["containers"].append(config)
+    services[config["id"]] = config
+    full_config["containers"] = list(services.values())
     path.write_text(json.dumps(full_config, indent=4))
 
     click.echo(f"Successfully added service '{config['id']}' to config.json.")
@@ -135,18 +156,16 @@ def remove_service_container(service_id: Optional[str], dir: str) -> None:
         click.confirm("Are you sure you want to remove all services?", abort=True)
         full_config["containers"] = []
     else:
+        # Index services by ID, preserving their order
+        services = {service["id"]: service for service in full_config["containers"]}
+
         # Ensure service ID exists
-        if not any(
-            service["id"] == service_id for service in full_config["containers"]
-        ):
+        if service_id not in services:
             raise click.ClickException(f"Service '{service_id}' does not exist.")
 
         # Remove service and rewrite config.json
-        full_config["containers"] = [
-            service
-            for service in full_config["containers"]
-            if service["id"] != service_id
-        ]
+        del services[service_id]
+        full_config["containers"] = list(services.values())
 
     path.write_text(json.dumps(full_config, indent=4))
     click.echo("Successfully removed service(s).")
@@ -1,12 +1,21 @@
-from typing import Dict, List
-from unittest.mock import Mock, patch
+from pathlib import Path
+from typing import Dict, Iterator, List
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
-from infernet_cli.github import github_list_files, github_pull_file
+from infernet_cli.github import _list_contents, github_list_files, github_pull_file
 
 
-@patch("infernet_cli.github.requests.get")
+@pytest.fixture(autouse=True)
+def clear_cache() -> Iterator[None]:
+    """Directory listings are cached, so start each test from a clean slate."""
+    _list_contents.cache_clear()
+    yield
+    _list_contents.cache_clear()
+
+
+@patch("infernet_cli.github.session.get")
 def test_github_list_files(mock_get: Mock) -> None:
     # Mock the API response
     mock_response: Mock = Mock()
@@ -30,7 +39,28 @@ def test_github_list_files(mock_get: Mock) -> None:
     assert dirs == ["dir1"]
 
 
-@patch("infernet_cli.github.requests.get")
+@patch("infernet_cli.github.session.get")
+def test_github_list_files_cached(mock_get: Mock) -> None:
+    mock_response: Mock = Mock()
+    mock_response.json.return_value = [
+        {"name": "file1.txt", "type": "file"},
+        {"name": "dir1", "type": "dir"},
+    ]
+    mock_get.return_value = mock_response
+
+    assert github_list_files("owner", "repo", "path") == ["file1.txt"]
+    assert github_list_files("owner", "repo", "path") == ["file1.txt"]
+    assert github_list_files("owner", "repo", "path", type="dir") == ["dir1"]
+
+    # Identical listings are served from the cache
+    mock_get.assert_called_once()
+
+    # Other branches are listed separately
+    github_list_files("owner", "repo", "path", branch="dev")
+    assert mock_get.call_count == 2
+
+
+@patch("infernet_cli.github.session.get")
 def test_github_list_files_custom_branch(mock_get: Mock) -> None:
     mock_response: Mock = Mock()
     mock_response.json.return_value = [{"name": "file1.txt", "type": "file"}]
@@ -42,7 +72,7 @@ def test_github_list_files_custom_branch(mock_get: Mock) -> None:
     )
 
 
-@patch("infernet_cli.github.requests.get")
+@patch("infernet_cli.github.session.get")
 def test_github_list_files_error(mock_get: Mock) -> None:
     mock_response: Mock = Mock()
     mock_response.raise_for_status.side_effect = Exception("API Error")
@@ -52,7 +82,7 @@ def test_github_list_files_error(mock_get: Mock) -> None:
         github_list_files("owner", "repo", "path")
 
 
-@patch("infernet_cli.github.requests.get")
+@patch("infernet_cli.github.session.get")
 def test_github_pull_file_text(mock_get: Mock) -> None:
     mock_response: Mock = Mock()
     mock_response.text = "file content"
@@ -66,7 +96,7 @@ def test_github_pull_file_text(mock_get: Mock) -> None:
     )
 
 
-@patch("infernet_cli.github.requests.get")
+@patch("infernet_cli.github.session.get")
 def test_github_pull_file_json(mock_get: Mock) -> None:
     mock_response: Mock = Mock()
     mock_response.json.return_value = {"key": "value"}
@@ -76,7 +106,25 @@ def test_github_pull_file_json(mock_get: Mock) -> None:
     assert content == {"key": "value"}
 
 
-@patch("infernet_cli.github.requests.get")
+@patch("infernet_cli.github.session.get")
+def test_github_pull_file_to_path(mock_get: MagicMock, tmp_path: Path) -> None:
+    mock_response: MagicMock = MagicMock()
+    mock_response.iter_content.return_value = [b"services:\n", b"  node: {}\n"]
+    mock_get.return_value.__enter__.return_value = mock_response
+
+    dest_path = str(tmp_path / "docker-compose.yaml")
+    assert github_pull_file("owner", "repo", "file.yaml", dest_path=dest_path) == (
+        dest_path
+    )
+    assert Path(dest_path).read_bytes() == b"services:\n  node: {}\n"
+    mock_get.assert_called_once_with(
+        "https://api.github.com/repos/owner/repo/contents/file.yaml?ref=main",
+        headers={"Accept": "application/vnd.github.v3.raw"},
+        stream=True,
+    )
+
+
+@patch("infernet_cli.github.session.get")
 def test_github_pull_file_custom_branch(mock_get: Mock) -> None:
     mock_response: Mock = Mock()
     mock_response.text = "file content"
@@ -89,7 +137,7 @@ def test_github_pull_file_custom_branch(mock_get: Mock) -> None:
     )
 
 
-@patch("infernet_cli.github.requests.get")
+@patch("infernet_cli.github.session.get")
 def test_github_pull_file_error(mock_get: Mock) -> None:
     mock_response: Mock = Mock()
     mock_response.status_code = 404
@@ -1,4 +1,6 @@
-from typing import List
+import threading
+from pathlib import Path
+from typing import Any, Iterator, List, Optional
 from unittest.mock import MagicMock, call, mock_open, patch
 
 import click
@@ -6,12 +8,22 @@ import pytest
 import requests
 
 from infernet_cli.node import (
+    _get_docker_image_tags,
     can_overwrite_file,
     get_compatible_node_versions,
     get_configs,
     get_docker_image_tags,
 )
 
+
+@pytest.fixture(autouse=True)
+def clear_cache() -> Iterator[None]:
+    """Docker image tags are cached, so start each test from a clean slate."""
+    _get_docker_image_tags.cache_clear()
+    yield
+    _get_docker_image_tags.cache_clear()
+
+
 # Test get_compatible_node_versions
 
 
@@ -39,6 +51,17 @@ def test_get_docker_image_tags(mock_get: MagicMock) -> None:
     assert mock_get.call_count == 2
 
 
+@patch("requests.get")
+def test_get_docker_image_tags_cached(mock_get: MagicMock) -> None:
+    mock_response = MagicMock()
+    mock_response.json.return_value = {"results": [{"name": "tag1"}], "next": None}
+    mock_get.return_value = mock_response
+
+    assert get_docker_image_tags("owner", "repo") == ["tag1"]
+    assert get_docker_image_tags("owner", "repo") == ["tag1"]
+    assert mock_get.call_count == 1
+
+
 @patch("requests.get")
 def test_get_docker_image_tags_error(mock_get: MagicMock) -> None:
     mock_get.side_effect = requests.RequestException()
@@ -104,6 +127,7 @@ def test_can_overwrite_file_abort(
 @patch("infernet_cli.node.github_pull_file")
 @patch("infernet_cli.node.fill_in_recipe")
 @patch("infernet_cli.node.can_overwrite_file")
+@patch("os.replace")
 @patch("builtins.open", new_callable=mock_open)
 @patch("click.echo")
 @patch("os.makedirs")
@@ -113,6 +137,7 @@ def test_get_configs(
     mock_makedirs: MagicMock,
     mock_echo: MagicMock,
     mock_file: MagicMock,
+    mock_replace: MagicMock,
     mock_can_overwrite: MagicMock,
     mock_fill: MagicMock,
     mock_pull: MagicMock,
@@ -148,16 +173,26 @@ def test_get_configs(
     )
 
     mock_fill.assert_called_once_with({"key0": "value0"}, {"key1": "value1"}, True)
-    assert mock_file.call_count == 2  # config.json and docker-compose.yaml
+    assert mock_file.call_count == 1  # config.json
+    mock_replace.assert_called_once_with(
+        "/test/dir/.docker-compose.yaml.download", "/test/dir/docker-compose.yaml"
+    )
     mock_pull.assert_has_calls(
         [
-            call("ritual-net", "infernet-recipes", "node/testchain/2.0.0/config.json"),
+            call(
+                "ritual-net",
+                "infernet-recipes",
+                "node/testchain/2.0.0/config.json",
+                dest_path=None,
+            ),
             call(
                 "ritual-net",
                 "infernet-recipes",
                 "node/testchain/2.0.0/docker-compose.yaml",
+                dest_path="/test/dir/.docker-compose.yaml.download",
             ),
-        ]
+        ],
+        any_order=True,
     )
 
 
@@ -177,11 +212,13 @@ def test_get_configs_invalid_version(
 @patch("infernet_cli.node.github_pull_file")
 @patch("infernet_cli.node.fill_in_recipe")
 @patch("infernet_cli.node.can_overwrite_file")
+@patch("os.replace")
 @patch("builtins.open", new_callable=mock_open)
 @patch("os.path.exists", return_value=True)
 def test_get_configs_gpu(
     mock_exists: MagicMock,
     mock_file: MagicMock,
+    mock_replace: MagicMock,
     mock_can_overwrite: MagicMock,
     mock_fill: MagicMock,
     mock_pull: MagicMock,
@@ -199,16 +236,104 @@ def test_get_configs_gpu(
 
     get_configs("testchain", "/test/dir", True, None, {"input": "value"})
 
-    assert mock_file.call_count == 2  # config.json and docker-compose-gpu.yaml
+    assert mock_file.call_count == 1  # config.json
+    mock_replace.assert_called_once_with(
+        "/test/dir/.docker-compose-gpu.yaml.download", "/test/dir/docker-compose.yaml"
+    )
     mock_can_overwrite.assert_called()
     mock_fill.assert_called_once()
     mock_pull.assert_has_calls(
         [
-            call("ritual-net", "infernet-recipes", "node/testchain/2.0.0/config.json"),
+            call(
+                "ritual-net",
+                "infernet-recipes",
+                "node/testchain/2.0.0/config.json",
+                dest_path=None,
+            ),
             call(
                 "ritual-net",
                 "infernet-recipes",
                 "node/testchain/2.0.0/docker-compose-gpu.yaml",
+                dest_path="/test/dir/.docker-compose-gpu.yaml.download",
             ),
-        ]
+        ],
+        any_order=True,
+    )
+
+
+@patch("infernet_cli.node.get_compatible_node_versions")
+@patch("infernet_cli.node.github_list_files")
+@patch("infernet_cli.node.github_pull_file")
+@patch("infernet_cli.node.fill_in_recipe")
+@patch("infernet_cli.node.can_overwrite_file")
+@patch("os.replace")
+@patch("builtins.open", new_callable=mock_open)
+@patch("os.path.exists", return_value=True)
+def test_get_configs_concurrent_fetch(
+    mock_exists: MagicMock,
+    mock_file: MagicMock,
+    mock_replace: MagicMock,
+    mock_can_overwrite: MagicMock,
+    mock_fill: MagicMock,
+    mock_pull: MagicMock,
+    mock_list: MagicMock,
+    mock_versions: MagicMock,
+) -> None:
+    mock_versions.return_value = ["2.0.0"]
+    mock_list.return_value = [
+        "config.json",
+        "docker-compose.yaml",
+        "docker-compose-gpu.yaml",
+    ]
+    mock_pull.side_effect = lambda owner, repo, path, dest_path: (
+        {"recipe": "config"} if dest_path is None else dest_path
+    )
+    mock_fill.side_effect = lambda recipe, inputs, skip: recipe
+
+    get_configs("testchain", "/test/dir", False, None, {})
+
+    # Both files are fetched, and contents are matched back to the right file
+    assert mock_pull.call_count == 2
+    mock_fill.assert_called_once_with({"recipe": "config"}, {}, False)
+    mock_file.return_value.write.assert_called_once_with('{\n    "recipe": "config"\n}')
+    mock_replace.assert_called_once_with(
+        "/test/dir/.docker-compose.yaml.download", "/test/dir/docker-compose.yaml"
     )
+
+
+@patch("infernet_cli.node.get_compatible_node_versions")
+@patch("infernet_cli.node.github_list_files")
+@patch("infernet_cli.node.github_pull_file")
+def test_get_configs_failed_fetch_cleans_up_downloads(
+    mock_pull: MagicMock,
+    mock_list: MagicMock,
+    mock_versions: MagicMock,
+    tmp_path: Path,
+) -> None:
+    mock_versions.return_value = ["2.0.0"]
+    mock_list.return_value = [
+        "config.json",
+        "docker-compose.yaml",
+        "docker-compose-gpu.yaml",
+    ]
+
+    # config.json fails once the docker-compose file is being downloaded
+    downloading = threading.Event()
+
+    def pull(owner: str, repo: str, path: str, dest_path: Optional[str]) -> Any:
+        if dest_path is None:
+            downloading.wait(timeout=5)
+            raise requests.exceptions.HTTPError("404 Client Error")
+        with open(dest_path, "w") as f:
+            downloading.set()
+            f.write("services: {}")
+        return dest_path
+
+    mock_pull.side_effect = pull
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        get_configs("testchain", str(tmp_path), False, None, {})
+
+    # The docker-compose file was downloaded, but not left behind
+    assert mock_pull.call_count == 2
+    assert list(tmp_path.iterdir()) == []
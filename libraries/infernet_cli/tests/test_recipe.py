@@ -56,6 +56,15 @@ def test_fill_in_recipe_with_provided_inputs(sample_recipe: InfernetRecipe) -> N
     assert result["command"] == "python main.py custom_arg"
 
 
+def test_fill_in_recipe_substitution_with_quotes(
+    sample_recipe: InfernetRecipe,
+) -> None:
+    inputs: Dict[str, Any] = {"input1": "test_value", "input3": '"quoted"'}
+    result: Dict[str, Any] = fill_in_recipe(sample_recipe, inputs)
+
+    assert result["command"] == 'python main.py "quoted"'
+
+
 def test_fill_in_recipe_with_default_values(sample_recipe: InfernetRecipe) -> None:
     inputs: Dict[str, str] = {"input1": "test_value"}
     result: Dict[str, Any] = fill_in_recipe(sample_recipe, inputs)
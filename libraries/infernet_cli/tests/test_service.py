@@ -1,5 +1,5 @@
 import json
-from typing import Any, Dict
+from typing import Any, Callable, Dict, List
 from unittest.mock import MagicMock, mock_open, patch
 
 import click
@@ -26,6 +26,17 @@ def mock_recipe() -> Dict[str, Any]:
     }
 
 
+def list_files_side_effect(
+    services: List[str], versions: List[str]
+) -> Callable[..., List[str]]:
+    """Mock github_list_files by path, since listings are fetched concurrently"""
+
+    def side_effect(owner: str, repo: str, path: str, **kwargs: Any) -> List[str]:
+        return services if path == "services" else versions
+
+    return side_effect
+
+
 # Tests for add_service_container
 
 
@@ -41,7 +52,7 @@ def test_add_service_container_with_recipe(
     mock_config: Dict[str, Any],
     mock_recipe: Dict[str, Any],
 ) -> None:
-    mock_list.side_effect = [["new-service"], ["1.0.0", "2.0.0"]]
+    mock_list.side_effect = list_files_side_effect(["new-service"], ["1.0.0", "2.0.0"])
     mock_pull.return_value = mock_recipe
     mock_fill.return_value = {"id": "new-service", "image": "new-image:latest"}
 
@@ -88,7 +99,7 @@ def test_add_service_container_invalid_version(
     mock_pull: MagicMock,
     mock_recipe: Dict[str, Any],
 ) -> None:
-    mock_list.side_effect = [["test-service"], ["1.0.0", "2.0.0"]]
+    mock_list.side_effect = list_files_side_effect(["test-service"], ["1.0.0", "2.0.0"])
     mock_pull.return_value = mock_recipe
     mock_fill.return_value = {"id": "test-service", "image": "test-image:latest"}
 
@@ -136,7 +147,7 @@ def test_add_service_container_config_not_found(
     mock_pull: MagicMock,
     mock_recipe: Dict[str, Any],
 ) -> None:
-    mock_list.side_effect = [["test-service"], ["1.0.0", "2.0.0"]]
+    mock_list.side_effect = list_files_side_effect(["test-service"], ["1.0.0", "2.0.0"])
     mock_pull.return_value = mock_recipe
     mock_fill.return_value = {"id": "test-service", "image": "test-image:latest"}
 
@@ -159,7 +170,7 @@ def test_add_service_container_invalid_json(
     mock_list: MagicMock,
     mock_pull: MagicMock,
 ) -> None:
-    mock_list.side_effect = [["test-service"], ["1.0.0", "2.0.0"]]
+    mock_list.side_effect = list_files_side_effect(["test-service"], ["1.0.0", "2.0.0"])
     mock_pull.return_value = mock_recipe
 
     mock_path_instance = MagicMock()
@@ -189,7 +200,7 @@ def test_add_service_container_overwrite_existing(
     mock_config: Dict[str, Any],
     mock_recipe: Dict[str, Any],
 ) -> None:
-    mock_list.side_effect = [["test-service"], ["1.0.0", "2.0.0"]]
+    mock_list.side_effect = list_files_side_effect(["test-service"], ["1.0.0", "2.0.0"])
     mock_pull.return_value = mock_recipe
     mock_fill.return_value = {"id": "test-service", "image": "new-image:latest"}
 
@@ -286,3 +297,48 @@ def test_remove_service_container_nonexistent_service(
     with pytest.raises(click.ClickException) as exc_info:
         remove_service_container("nonexistent-service", "/test/dir")
     assert str(exc_info.value) == "Service 'nonexistent-service' does not exist."
+
+
+@patch("infernet_cli.service.Path")
+def test_remove_service_container_preserves_order(mock_path: MagicMock) -> None:
+    mock_path_instance = MagicMock()
+    mock_path_instance.exists.return_value = True
+    mock_path_instance.read_bytes.return_value = json.dumps(
+        {"containers": [{"id": "service-1"}, {"id": "service-2"}, {"id": "service-3"}]}
+    ).encode()
+    mock_path.return_value = mock_path_instance
+
+    remove_service_container("service-2", "/test/dir")
+
+    written_config = json.loads(mock_path_instance.write_text.call_args[0][0])
+    assert [service["id"] for service in written_config["containers"]] == [
+        "service-1",
+        "service-3",
+    ]
+
+
+@patch("infernet_cli.service.sys.stdin")
+@patch("infernet_cli.service.Path")
+def test_add_service_container_preserves_large_integers(
+    mock_path: MagicMock, mock_stdin: MagicMock
+) -> None:
+    # Wei amounts overflow 64 bits, and must not be rewritten as floats
+    amount = 100 * 2**64
+    mock_stdin.read.return_value = json.dumps(
+        {"id": "manual-service", "payment": {"amount": amount}}
+    )
+
+    mock_path_instance = MagicMock()
+    mock_path_instance.exists.return_value = True
+    mock_path_instance.read_bytes.return_value = json.dumps(
+        {"containers": [], "chain": {"min_payment": amount}}
+    ).encode()
+    mock_path.return_value = mock_path_instance
+
+    add_service_container(None, "/test/dir", None)
+
+    written = mock_path_instance.write_text.call_args[0][0]
+    written_config = json.loads(written)
+    assert written_config["chain"]["min_payment"] == amount
+    assert written_config["containers"][0]["payment"]["amount"] == amount
+    assert "e+" not in written
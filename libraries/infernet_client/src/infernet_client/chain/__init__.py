@@ -0,0 +1,13 @@
+from typing import cast
+
+from eth_hash.utils import auto_choose_backend
+from eth_typing import ChecksumAddress
+
+ZERO_ADDRESS = cast(ChecksumAddress, "0x0000000000000000000000000000000000000000")
+
+# Resolve the keccak backend once at import (honouring `ETH_HASH_BACKEND`, otherwise
+# preferring pycryptodome's C implementation), rather than dispatching through
+# eth-hash's auto backend on every hash
+keccak256 = auto_choose_backend().keccak256
+
+__all__ = ["ZERO_ADDRESS", "keccak256"]
@@ -5,11 +5,31 @@ A simple module containing all of the ABIs that `infernet-client`'s classes use.
 - `WALLET_FACTORY_ABI`: The ABI for the `WalletFactory` contract.
 - `WALLET_ABI`: The ABI for the `Wallet` contract.
 - `ERC20_ABI`: The ABI for an `ERC20` contract.
+- `MULTICALL3_ABI`: The ABI for the `Multicall3` contract's `aggregate` function.
+
+ABIs are immutable tuples. Each ABI also has a precomputed mapping of function name to
+its 4-byte selector, so callers don't have to re-derive them from the ABI:
+
+### Selectors
+- `WALLET_FACTORY_SELECTORS`: Function selectors of the `WalletFactory` contract.
+- `WALLET_SELECTORS`: Function selectors of the `Wallet` contract.
+- `ERC20_SELECTORS`: Function selectors of an `ERC20` contract.
+
+### Calldata
+- `address_calldata(selector: bytes, address: str) -> bytes`: Calldata for a function
+that takes a single `address` argument, encoded without going through eth-abi.
+- `uint_result(result: bytes) -> int`: Decodes the return data of a function that
+returns a single `uint256` (or `bool`), without going through eth-abi.
 """
 
+from types import MappingProxyType
+from typing import Final, Mapping
+
+from eth_utils.abi import function_abi_to_4byte_selector
+from web3.exceptions import BadFunctionCallOutput
 from web3.types import ABI
 
-WALLET_FACTORY_ABI: ABI = [
+WALLET_FACTORY_ABI: Final[ABI] = (
     {
         "type": "function",
         "name": "isValidWallet",
@@ -24,9 +44,9 @@ WALLET_FACTORY_ABI: ABI = [
         "outputs": [{"name": "", "type": "address"}],
         "stateMutability": "nonpayable",
     },
-]
+)
 
-WALLET_ABI: ABI = [
+WALLET_ABI: Final[ABI] = (
     {
         "type": "function",
         "name": "approve",
@@ -65,9 +85,9 @@ WALLET_ABI: ABI = [
         "outputs": [],
         "stateMutability": "nonpayable",
     },
-]
+)
 
-ERC20_ABI: ABI = [
+ERC20_ABI: Final[ABI] = (
     {
         "type": "function",
         "name": "balanceOf",
@@ -85,4 +105,84 @@ ERC20_ABI: ABI = [
         "outputs": [{"name": "", "type": "bool"}],
         "stateMutability": "nonpayable",
     },
-]
+)
+
+MULTICALL3_ABI: Final[ABI] = (
+    {
+        "type": "function",
+        "name": "aggregate",
+        "inputs": [
+            {
+                "name": "calls",
+                "type": "tuple[]",
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "callData", "type": "bytes"},
+                ],
+            }
+        ],
+        "outputs": [
+            {"name": "blockNumber", "type": "uint256"},
+            {"name": "returnData", "type": "bytes[]"},
+        ],
+        "stateMutability": "payable",
+    },
+)
+
+
+def _function_selectors(abi: ABI) -> Mapping[str, bytes]:
+    """Maps each function in an ABI to its 4-byte selector
+
+    Args:
+        abi (ABI): Contract ABI
+
+    Returns:
+        Mapping[str, bytes]: Read-only mapping of function name to selector
+    """
+    return MappingProxyType(
+        {
+            item["name"]: function_abi_to_4byte_selector(dict(item))
+            for item in abi
+            if item["type"] == "function"
+        }
+    )
+
+
+WALLET_FACTORY_SELECTORS: Final = _function_selectors(WALLET_FACTORY_ABI)
+WALLET_SELECTORS: Final = _function_selectors(WALLET_ABI)
+ERC20_SELECTORS: Final = _function_selectors(ERC20_ABI)
+
+
+def address_calldata(selector: bytes, address: str) -> bytes:
+    """Builds calldata for a function that takes a single `address` argument
+
+    Args:
+        selector (bytes): 4-byte function selector
+        address (str): Hex address argument
+
+    Returns:
+        bytes: Selector followed by the left-padded 32-byte address
+    """
+    return selector + bytes(12) + bytes.fromhex(address[2:])
+
+
+def uint_result(result: bytes) -> int:
+    """Decodes the return data of a function that returns a single `uint256` (or
+    `bool`)
+
+    Args:
+        result (bytes): Raw return data
+
+    Returns:
+        int: Decoded value
+
+    Raises:
+        BadFunctionCallOutput: Return data is not a single 32-byte word, e.g. the
+            called address is not a contract
+    """
+    if len(result) != 32:
+        raise BadFunctionCallOutput(
+            f"Could not decode uint256 from {len(result)} bytes of return data: "
+            f"{result.hex()!r}"
+        )
+    return int.from_bytes(result, "big")
@@ -21,8 +21,16 @@ async def main():
 
 ## Public Methods
 
+- `readonly(rpc_url: str) -> RPC`: Returns a read-only RPC client, which can't be
+initialized with an account or send transactions
+- `from_websocket(rpc_url: str) -> RPC`: Returns an RPC client over a persistent
+websocket connection
+- `disconnect()`: Closes the connection of an RPC client. RPC clients are also async
+context managers, which disconnect on exit
 - `initialize_with_private_key(private_key: str) -> RPC`: Initializes RPC client with
 private key
+- `initialize_with_account(account: LocalAccount) -> RPC`: Initializes RPC client with
+an account
 - `get_checksum_address(address: str) -> ChecksumAddress`: Returns a checksummed Ethereum
 address
 - `get_contract(address: ChecksumAddress, abi: ABI) -> AsyncContract`: Returns a web3py
@@ -30,49 +38,198 @@ async contract instance
 - `get_balance(address: ChecksumAddress) -> int`: Collects balance for an address
 - `get_nonce(address: ChecksumAddress) -> Nonce`: Collects nonce for an address
 - `get_chain_id() -> int`: Collects connected RPC's chain ID
-- `get_tx_receipt(tx_hash: HexBytes)`: Returns transaction receipt
+- `get_transaction_params() -> TxParams`: Collects the nonce, fees and chain ID for a
+transaction from the account, concurrently
+- `get_tx_receipt(tx_hash: HexBytes, timeout: float)`: Returns transaction receipt,
+waiting for the transaction to be mined
 - `send_transaction(tx: TxParams) -> HexBytes`: Sends a transaction
+- `call(tx: TxParams) -> bytes`: Executes a read-only call with raw calldata
 """
 
 from __future__ import annotations
 
-from typing import Optional, Type
+import asyncio
+import re
+from functools import lru_cache
+from typing import Any, Optional, Type, cast
 
 from eth_account import Account
+from eth_account.signers.local import LocalAccount
 from eth_typing import ChecksumAddress
 from hexbytes import HexBytes
-from web3 import AsyncHTTPProvider, AsyncWeb3
+from web3 import AsyncHTTPProvider, AsyncWeb3, Web3, WebsocketProviderV2
+from web3._utils.request import async_cache_and_return_session
 from web3.contract import AsyncContract  # type: ignore
+from web3.exceptions import TimeExhausted, TransactionNotFound
 from web3.middleware.signing import async_construct_sign_and_send_raw_middleware
-from web3.types import ABI, Nonce, TxParams, TxReceipt
+from web3.providers.persistent import PersistentConnectionProvider
+from web3.types import ABI, Nonce, TxParams, TxReceipt, Wei
+
+from infernet_client.chain import keccak256
+
+# Receipt polling starts at this interval (in seconds), backing off to the max
+RECEIPT_POLL_INTERVAL = 0.25
+RECEIPT_POLL_INTERVAL_MAX = 4.0
+RECEIPT_TIMEOUT = 120.0
+
+# HTTP providers by RPC url. web3py pools aiohttp sessions per endpoint, sharing the
+# provider lets every RPC instance for an endpoint reuse the same connections
+_PROVIDERS: dict[str, AsyncHTTPProvider] = {}
+
+# Number of connected RPC instances sharing each provider. The endpoint's HTTP session
+# is closed once the last of them disconnects
+_PROVIDER_USERS: dict[str, int] = {}
+
+# Unchecksummed hex address, with or without the 0x prefix
+_HEX_ADDRESS = re.compile(r"(?:0[xX])?[0-9a-fA-F]{40}")
+_CASE_BITS = bytes.maketrans(b"0123456789abcdef", b"\x00" * 8 + b"\x20" * 8)
+_LETTER_BITS = int.from_bytes(b"\x40" * 40, "big")
+
+
+@lru_cache(maxsize=1024)
+def _checksum(address: str) -> ChecksumAddress:
+    """Returns a checksummed Ethereum address, memoized since EIP-55 checksumming
+    requires a keccak of the address and the same addresses are checksummed repeatedly
+
+    Args:
+        address (str): Stringified address
+
+    Returns:
+        ChecksumAddress: Checksum-validated Ethereum address
+    """
+    if not _HEX_ADDRESS.fullmatch(address):
+        # Let web3py validate (and reject) anything that isn't a plain hex address
+        return Web3.to_checksum_address(address)
+
+    # EIP-55: uppercase each letter whose matching nibble of the keccak of the
+    # lowercase address is >= 8. Done branch-free over the address as one integer:
+    # map hash nibbles >= 8 to the 0x20 case bit, keep it only under letters (which
+    # have 0x40 set, unlike digits), then flip it off
+    lower = address[-40:].lower().encode()
+    digest = keccak256(lower).hex()[:40].encode()
+    flip = int.from_bytes(digest.translate(_CASE_BITS), "big")
+    chars = int.from_bytes(lower, "big")
+    checksummed = chars ^ (flip & ((chars & _LETTER_BITS) >> 1))
+    return cast(ChecksumAddress, "0x" + checksummed.to_bytes(40, "big").decode())
 
 
 class RPC:
-    def __init__(self, rpc_url: str) -> None:
+    def __init__(self, rpc_url: str, web3: Optional[AsyncWeb3] = None) -> None:
         """Initializes new Ethereum-compatible JSON-RPC client
 
         Args:
             rpc_url (str): HTTP(s) RPC url
+            web3 (Optional[AsyncWeb3]): Connected web3py client to use instead of an
+                HTTP client, e.g. a persistent websocket connection. Defaults to None.
 
         Raises:
             ValueError: RPC URL is incorrectly formatted
         """
 
-        # Setup new Web3 HTTP provider w/ 10 minute timeout
-        # Long timeout is useful for event polling, subscriptions
-        provider = AsyncHTTPProvider(
-            endpoint_uri=rpc_url, request_kwargs={"timeout": 60 * 10}
+        if web3 is None:
+            # Setup Web3 HTTP provider w/ 10 minute timeout, shared across RPC
+            # instances connecting to the same endpoint
+            # Long timeout is useful for event polling, subscriptions
+            provider = _PROVIDERS.get(rpc_url)
+            if provider is None:
+                provider = _PROVIDERS[rpc_url] = AsyncHTTPProvider(
+                    endpoint_uri=rpc_url, request_kwargs={"timeout": 60 * 10}
+                )
+            _PROVIDER_USERS[rpc_url] = _PROVIDER_USERS.get(rpc_url, 0) + 1
+            shared_url: Optional[str] = rpc_url
+            web3 = AsyncWeb3(provider)
+            # Read-only calls go through a separate client over the same provider,
+            # which never has signing middleware installed
+            reader = AsyncWeb3(provider)
+        else:
+            reader = web3
+            shared_url = None
+
+        self._web3: AsyncWeb3 = web3
+        self._reader: AsyncWeb3 = reader
+        self._account: Optional[LocalAccount] = None
+        self._chain_id: Optional[int] = None
+        self._shared_url: Optional[str] = shared_url
+        self._connected = True
+        self._readonly = False
+
+    @classmethod
+    async def from_websocket(cls: Type[RPC], rpc_url: str) -> RPC:
+        """Returns an RPC client over a persistent websocket connection. Suited to
+        workloads that poll heavily (e.g. waiting on receipts), since requests reuse
+        one connection rather than going through HTTP request/response cycles
+
+        Args:
+            rpc_url (str): WS(s) RPC url
+
+        Returns:
+            RPC: Connected RPC client, close it with `disconnect()`
+        """
+        web3 = await AsyncWeb3.persistent_websocket(
+            WebsocketProviderV2(rpc_url, request_timeout=60 * 10)
         )
+        return cls(rpc_url, web3=web3)
+
+    async def disconnect(self: RPC) -> None:
+        """Closes the RPC client's connection: the persistent connection of a
+        websocket client, or the pooled HTTP session of the client's endpoint. The
+        HTTP session is shared by every RPC client of the endpoint, so it is only
+        closed once the last of them disconnects. Disconnecting again is a no-op
+        """
+        if not self._connected:
+            return
+        self._connected = False
+
+        provider = self._web3.provider
+        if isinstance(provider, PersistentConnectionProvider):
+            await provider.disconnect()
+            return
+        if not isinstance(provider, AsyncHTTPProvider) or not provider.endpoint_uri:
+            return
+
+        url = self._shared_url or str(provider.endpoint_uri)
+        if self._shared_url is not None:
+            _PROVIDER_USERS[url] -= 1
+            if _PROVIDER_USERS[url] == 0:
+                del _PROVIDER_USERS[url], _PROVIDERS[url]
+        if _PROVIDER_USERS.get(url):
+            # Other RPC clients are still using the endpoint's session
+            return
+
+        # Close the session within its event loop, rather than leaving it to be
+        # garbage collected once the loop is closed
+        session = await async_cache_and_return_session(provider.endpoint_uri)
+        await session.close()
+
+    async def __aenter__(self: RPC) -> RPC:
+        return self
+
+    async def __aexit__(self: RPC, *_: Any) -> None:
+        await self.disconnect()
+
+    @classmethod
+    def readonly(cls: Type[RPC], rpc_url: str) -> RPC:
+        """Returns an RPC client for read-only use (e.g. balance and validity
+        checks). It can't be initialized with an account or send transactions
+
+        Args:
+            rpc_url (str): HTTP(s) RPC url
 
-        self._web3: AsyncWeb3 = AsyncWeb3(provider)
-        self._account: Optional[Account] = None
+        Returns:
+            RPC: Read-only RPC client
+        """
+        rpc = cls(rpc_url)
+        # Nothing is signed, so contracts are built on the reading client too
+        rpc._web3 = rpc._reader
+        rpc._readonly = True
+        return rpc
 
     @property
-    def account(self: RPC) -> Account:
+    def account(self: RPC) -> LocalAccount:
         """Returns account instance, if it exists
 
         Returns:
-            Account: Account instance
+            LocalAccount: Account instance
         """
 
         if self._account is None:
@@ -80,12 +237,27 @@ class RPC:
         return self._account
 
     async def initialize_with_private_key(self: RPC, private_key: str) -> RPC:
-        """Initializes RPC client with private key
+        """Initializes RPC client with private key. To share one account across RPC
+        clients, derive it once and use `initialize_with_account()` instead
 
         Args:
             private_key (str): Private key
         """
-        account = self._web3.eth.account.from_key(private_key)
+        return await self.initialize_with_account(Account.from_key(private_key))
+
+    async def initialize_with_account(self: RPC, account: LocalAccount) -> RPC:
+        """Initializes RPC client with an account
+
+        Args:
+            account (LocalAccount): Account to sign transactions with
+
+        Raises:
+            ValueError: RPC client is read-only
+        """
+        if self._readonly:
+            raise ValueError(
+                "Read-only RPC client can't be initialized with an account"
+            )
         self._account = account
         self._web3.middleware_onion.add(
             await async_construct_sign_and_send_raw_middleware(account)
@@ -102,7 +274,8 @@ class RPC:
         Returns:
             ChecksumAddress: Checksum-validated Ethereum address
         """
-        return self._web3.to_checksum_address(address)
+        # Normalize casing so differently-cased inputs share a cache entry
+        return _checksum(address.lower())
 
     def get_contract(
         self,
@@ -132,7 +305,7 @@ class RPC:
         Returns:
             int: Balance in wei
         """
-        return await self._web3.eth.get_balance(address)
+        return await self._reader.eth.get_balance(address)
 
     async def get_nonce(self, address: ChecksumAddress) -> Nonce:
         """Collects nonce for an address
@@ -143,22 +316,83 @@ class RPC:
         Returns:
             Nonce: Transaction count (nonce)
         """
-        return await self._web3.eth.get_transaction_count(address)
+        return await self._reader.eth.get_transaction_count(address)
 
     async def get_chain_id(self) -> int:
-        """Collects connected RPC's chain ID
+        """Collects connected RPC's chain ID. The chain ID of an endpoint doesn't
+        change, so it is only requested once per RPC client
 
         Returns:
             int: Chain ID
         """
-        return await self._web3.eth.chain_id
+        if self._chain_id is None:
+            self._chain_id = await self._reader.eth.chain_id
+        return self._chain_id
+
+    async def get_transaction_params(self) -> TxParams:
+        """Collects the nonce, fees and chain ID for a transaction sent from the
+        account. Left out of a transaction, web3py's signing middleware requests each
+        of these one after the other, here they are requested concurrently. The fees
+        are derived as web3py does, and are omitted if a gas price strategy is set
+
+        Returns:
+            TxParams: Transaction parameters, to pass along to `transact()` or merge
+                into a transaction
+        """
+        address = self.account.address
+        eth = self._reader.eth
+        if self._web3.eth.generate_gas_price({}) is not None:
+            nonce, chain_id = await asyncio.gather(
+                eth.get_transaction_count(address, "pending"), self.get_chain_id()
+            )
+            return {"from": address, "nonce": nonce, "chainId": chain_id}
+
+        nonce, block, priority_fee, chain_id = await asyncio.gather(
+            eth.get_transaction_count(address, "pending"),
+            eth.get_block("latest"),
+            eth.max_priority_fee,
+            self.get_chain_id(),
+        )
+        return {
+            "from": address,
+            "nonce": nonce,
+            "maxFeePerGas": Wei(priority_fee + 2 * block["baseFeePerGas"]),
+            "maxPriorityFeePerGas": priority_fee,
+            "chainId": chain_id,
+        }
+
+    async def get_tx_receipt(
+        self, tx_hash: HexBytes, timeout: float = RECEIPT_TIMEOUT
+    ) -> TxReceipt:
+        """Returns transaction receipt, waiting for the transaction to be mined
+
+        Polls with an interval that backs off from `RECEIPT_POLL_INTERVAL` up to
+        `RECEIPT_POLL_INTERVAL_MAX`, so that waiting on a block does not issue a
+        receipt request every 100ms.
 
-    async def get_tx_receipt(self, tx_hash: HexBytes) -> TxReceipt:
-        """Returns transaction receipt
         Args:
             tx_hash (HexBytes): Transaction hash
+            timeout (float): Seconds to wait for the receipt. Defaults to 120.
+
+        Raises:
+            TimeExhausted: Transaction was not mined within `timeout` seconds
         """
-        return await self._web3.eth.wait_for_transaction_receipt(tx_hash)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        interval = RECEIPT_POLL_INTERVAL
+        while True:
+            try:
+                return await self._reader.eth.get_transaction_receipt(tx_hash)
+            except TransactionNotFound:
+                pass
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise TimeExhausted(
+                    f"Transaction {tx_hash.hex()} is not in the chain after "
+                    f"{timeout} seconds"
+                )
+            await asyncio.sleep(min(interval, remaining))
+            interval = min(RECEIPT_POLL_INTERVAL_MAX, interval * 1.5)
 
     async def send_transaction(self, tx: TxParams) -> HexBytes:
         """Sends a transaction
@@ -168,5 +402,22 @@ class RPC:
 
         Returns:
             HexBytes: Transaction hash
+
+        Raises:
+            ValueError: RPC client is read-only
         """
+        if self._readonly:
+            raise ValueError("Read-only RPC client can't send transactions")
         return await self._web3.eth.send_transaction(tx)
+
+    async def call(self, tx: TxParams) -> bytes:
+        """Executes a read-only call with raw calldata, skipping contract ABI encoding
+        and decoding
+
+        Args:
+            tx (dict): Transaction dictionary, with `to` and `data` set
+
+        Returns:
+            bytes: Raw return data
+        """
+        return await self._reader.eth.call(tx)
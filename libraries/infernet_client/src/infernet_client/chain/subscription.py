@@ -1,12 +1,85 @@
 from __future__ import annotations
 
-from typing import Any, List
+from functools import lru_cache
+from typing import Any, Final, List
 
 from eth_abi.abi import encode
-from eth_account.messages import SignableMessage, encode_typed_data
+from eth_account.messages import SignableMessage
 from eth_typing import ChecksumAddress
 from hexbytes import HexBytes
-from web3 import Web3
+
+from infernet_client.chain import keccak256
+
+# EIP-712 type hashes of the DelegateSubscription schema. Referenced struct types are
+# appended to the encoded type, per the spec
+_SUBSCRIPTION_TYPE: Final = (
+    b"Subscription(address owner,uint32 activeAt,uint32 period,uint32 frequency,"
+    b"uint16 redundancy,bytes32 containerId,bool lazy,address verifier,"
+    b"uint256 paymentAmount,address paymentToken,address wallet)"
+)
+_SUBSCRIPTION_TYPEHASH: Final = keccak256(_SUBSCRIPTION_TYPE)
+_DELEGATE_SUBSCRIPTION_TYPEHASH: Final = keccak256(
+    b"DelegateSubscription(uint32 nonce,uint32 expiry,Subscription sub)"
+    + _SUBSCRIPTION_TYPE
+)
+_DOMAIN_TYPEHASH: Final = keccak256(
+    b"EIP712Domain(string name,string version,uint256 chainId,"
+    b"address verifyingContract)"
+)
+_DOMAIN_NAME_HASH: Final = keccak256(b"InfernetCoordinator")
+_DOMAIN_VERSION_HASH: Final = keccak256(b"1")
+
+
+@lru_cache(maxsize=64)
+def _domain_separator(chain_id: int, verifying_contract: ChecksumAddress) -> bytes:
+    """Computes the EIP-712 domain separator of an Infernet coordinator
+
+    Args:
+        chain_id (int): Contract chain ID
+        verifying_contract (ChecksumAddress): Coordinator contract address
+
+    Returns:
+        bytes: Domain separator
+    """
+    return keccak256(
+        _DOMAIN_TYPEHASH
+        + _DOMAIN_NAME_HASH
+        + _DOMAIN_VERSION_HASH
+        + encode(["uint256", "address"], [chain_id, verifying_contract])
+    )
+
+
+def _encode_string(value: str) -> bytes:
+    """ABI-encodes a single `string` argument, equivalent to
+    `eth_abi.encode(["string"], [value])` without going through the codec registry
+
+    Args:
+        value (str): String to encode
+
+    Returns:
+        bytes: Head offset, length, then the UTF-8 bytes padded to 32 bytes
+    """
+    data = value.encode()
+    return (
+        (32).to_bytes(32, "big")
+        + len(data).to_bytes(32, "big")
+        + data
+        + bytes(-len(data) % 32)
+    )
+
+
+@lru_cache(maxsize=4096)
+def _containers_hash(containers: tuple[str, ...]) -> bytes:
+    """Hashes container IDs, memoized since subscriptions are typically created for a
+    small set of container lists
+
+    Args:
+        containers (tuple[str, ...]): Container IDs
+
+    Returns:
+        bytes: keccak256 hash of the ABI-encoded, comma-separated container IDs
+    """
+    return keccak256(_encode_string(",".join(containers)))
 
 
 class Subscription:
@@ -28,14 +101,33 @@ class Subscription:
         _redundancy (int): Number of unique nodes that can fulfill each interval
         _containers_hash (str): Hash of container IDs, this is keccack256 hash of
             comma-separated container IDs
+        _containers_hash_bytes (bytes): Raw bytes of `_containers_hash`
         _lazy (bool): Lazy flag
         _verifier (str): Verifier address
         _payment_amount (int): Payment amount
         _payment_token (str): Payment token address
         _wallet (str): Wallet address of the subscription owner, where payments are
             made from
+        _struct_hash (bytes): EIP-712 struct hash of the subscription, precomputed
+            since it is invariant across signatures
     """
 
+    __slots__ = (
+        "owner",
+        "_active_at",
+        "_period",
+        "_frequency",
+        "_redundancy",
+        "_containers_hash",
+        "_containers_hash_bytes",
+        "_lazy",
+        "_verifier",
+        "_payment_amount",
+        "_payment_token",
+        "_wallet",
+        "_struct_hash",
+    )
+
     def __init__(
         self,
         owner: str,
@@ -71,14 +163,44 @@ class Subscription:
         self._period = period
         self._frequency = frequency
         self._redundancy = redundancy
-        self._containers_hash = Web3.keccak(
-            encode(["string"], [",".join(containers)])
-        ).hex()
+        self._containers_hash_bytes = _containers_hash(tuple(containers))
+        self._containers_hash = "0x" + self._containers_hash_bytes.hex()
         self._lazy = lazy
         self._verifier = verifier
         self._payment_amount = payment_amount
         self._payment_token = payment_token
         self._wallet = wallet
+        self._struct_hash = keccak256(
+            _SUBSCRIPTION_TYPEHASH
+            + encode(
+                [
+                    "address",
+                    "uint32",
+                    "uint32",
+                    "uint32",
+                    "uint16",
+                    "bytes32",
+                    "bool",
+                    "address",
+                    "uint256",
+                    "address",
+                    "address",
+                ],
+                [
+                    owner,
+                    active_at,
+                    period,
+                    frequency,
+                    redundancy,
+                    self._containers_hash_bytes,
+                    lazy,
+                    verifier,
+                    payment_amount,
+                    payment_token,
+                    wallet,
+                ],
+            )
+        )
 
     @property
     def serialized(self) -> dict[str, Any]:
@@ -119,57 +241,13 @@ class Subscription:
         Returns:
             SignableMessage: Typed, signable DelegateSubscription message
         """
-        return encode_typed_data(
-            full_message={
-                "types": {
-                    "EIP712Domain": [
-                        {"name": "name", "type": "string"},
-                        {"name": "version", "type": "string"},
-                        {"name": "chainId", "type": "uint256"},
-                        {"name": "verifyingContract", "type": "address"},
-                    ],
-                    "DelegateSubscription": [
-                        {"name": "nonce", "type": "uint32"},
-                        {"name": "expiry", "type": "uint32"},
-                        {"name": "sub", "type": "Subscription"},
-                    ],
-                    "Subscription": [
-                        {"name": "owner", "type": "address"},
-                        {"name": "activeAt", "type": "uint32"},
-                        {"name": "period", "type": "uint32"},
-                        {"name": "frequency", "type": "uint32"},
-                        {"name": "redundancy", "type": "uint16"},
-                        {"name": "containerId", "type": "bytes32"},
-                        {"name": "lazy", "type": "bool"},
-                        {"name": "verifier", "type": "address"},
-                        {"name": "paymentAmount", "type": "uint256"},
-                        {"name": "paymentToken", "type": "address"},
-                        {"name": "wallet", "type": "address"},
-                    ],
-                },
-                "primaryType": "DelegateSubscription",
-                "domain": {
-                    "name": "InfernetCoordinator",
-                    "version": "1",
-                    "chainId": chain_id,
-                    "verifyingContract": verifying_contract,
-                },
-                "message": {
-                    "nonce": nonce,
-                    "expiry": expiry,
-                    "sub": {
-                        "owner": self.owner,
-                        "activeAt": self._active_at,
-                        "period": self._period,
-                        "frequency": self._frequency,
-                        "redundancy": self._redundancy,
-                        "containerId": HexBytes(self._containers_hash),
-                        "lazy": self._lazy,
-                        "verifier": self._verifier,
-                        "paymentAmount": self._payment_amount,
-                        "paymentToken": self._payment_token,
-                        "wallet": self._wallet,
-                    },
-                },
-            }
+        message_hash = keccak256(
+            _DELEGATE_SUBSCRIPTION_TYPEHASH
+            + encode(["uint32", "uint32"], [nonce, expiry])
+            + self._struct_hash
+        )
+        return SignableMessage(
+            HexBytes(b"\x01"),
+            _domain_separator(chain_id, verifying_contract),
+            message_hash,
         )
@@ -28,16 +28,21 @@ async def main():
 
 from __future__ import annotations
 
-from typing import cast
+from typing import Optional
 
 from eth_typing import ChecksumAddress
-from web3.types import TxReceipt, Wei
-
-from infernet_client.chain.abis import ERC20_ABI
+from web3.types import TxParams, TxReceipt, Wei
+
+# ZERO_ADDRESS lives in the chain package, it's re-exported here for existing imports
+from infernet_client.chain import ZERO_ADDRESS  # noqa: F401
+from infernet_client.chain.abis import (
+    ERC20_ABI,
+    ERC20_SELECTORS,
+    address_calldata,
+    uint_result,
+)
 from infernet_client.chain.rpc import RPC
 
-ZERO_ADDRESS = cast(ChecksumAddress, "0x0000000000000000000000000000000000000000")
-
 
 class Token:
     def __init__(self, address: ChecksumAddress, rpc: RPC):
@@ -64,21 +69,30 @@ class Token:
 
         Args:
             address: The address to get the balance of.
+
+        Raises:
+            BadFunctionCallOutput: The token returned no (or malformed) data, e.g. it
+                is not deployed on the connected chain
         """
 
-        return cast(Wei, await self._contract.functions.balanceOf(address).call())
+        data = address_calldata(ERC20_SELECTORS["balanceOf"], address)
+        result = await self._rpc.call({"to": self.address, "data": data})
+        return Wei(uint_result(result))
 
-    async def transfer(self, to: ChecksumAddress, amount: Wei) -> TxReceipt:
+    async def transfer(
+        self, to: ChecksumAddress, amount: Wei, tx: Optional[TxParams] = None
+    ) -> TxReceipt:
         """
         Transfer tokens to an address.
 
         Args:
             to: The address to transfer tokens to.
             amount: The amount of tokens to transfer.
+            tx: Transaction parameters, e.g. from `RPC.get_transaction_params()`.
 
         Returns:
             The transaction receipt.
         """
 
-        tx = await self._contract.functions.transfer(to, amount).transact()
-        return await self._rpc.get_tx_receipt(tx)
+        tx_hash = await self._contract.functions.transfer(to, amount).transact(tx)
+        return await self._rpc.get_tx_receipt(tx_hash)
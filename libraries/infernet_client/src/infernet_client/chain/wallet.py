@@ -13,23 +13,34 @@ Approve a spender to spend a certain amount of tokens
 - `get_balance() -> int`: Get the native balance of the wallet
 - `get_token_balance(token: ChecksumAddress) -> int`: Get the balance of a token in the
 wallet
+- `get_token_balances(tokens: list[ChecksumAddress]) -> dict[ChecksumAddress, int]`:
+Get the balances of many tokens in the wallet, in a single `Multicall3` call
 - `withdraw(token: ChecksumAddress, amount: int) -> TxReceipt`:
 Withdraw an amount of unlocked tokens (only by wallet owner)"""
 
 from __future__ import annotations
 
 import logging
+from typing import Optional, cast
 
 from eth_typing import ChecksumAddress
-from web3 import Web3
-from web3.types import TxReceipt
-
-from infernet_client.chain.abis import WALLET_ABI
+from web3.types import TxParams, TxReceipt
+
+from infernet_client.chain.abis import (
+    ERC20_SELECTORS,
+    MULTICALL3_ABI,
+    WALLET_ABI,
+    address_calldata,
+    uint_result,
+)
 from infernet_client.chain.rpc import RPC
 from infernet_client.chain.token import Token
 
 log = logging.getLogger(__name__)
 
+# Multicall3 is deployed at the same address on most EVM chains
+MULTICALL3_ADDRESS = cast(ChecksumAddress, "0xcA11bde05977b3631167028862bE2a173976CA11")
+
 
 class InfernetWallet:
     def __init__(self, address: ChecksumAddress, rpc: RPC):
@@ -41,9 +52,15 @@ class InfernetWallet:
         self.address = address
         self._rpc = rpc
         self._contract = rpc.get_contract(address=address, abi=WALLET_ABI)
+        # Token contracts by address, reused across balance reads
+        self._tokens: dict[ChecksumAddress, Token] = {}
 
     async def approve(
-        self, spender: ChecksumAddress, token: ChecksumAddress, amount: int
+        self,
+        spender: ChecksumAddress,
+        token: ChecksumAddress,
+        amount: int,
+        tx: Optional[TxParams] = None,
     ) -> TxReceipt:
         """
         Approve a spender to spend a certain amount of tokens
@@ -52,15 +69,18 @@ class InfernetWallet:
             spender: The address of the spender
             token: The address of the token to approve
             amount: The amount to approve
+            tx: Transaction parameters, e.g. from `RPC.get_transaction_params()`
 
         Returns:
             The transaction receipt
         """
         tx_hash = await self._contract.functions.approve(
             spender, token, amount
-        ).transact()
+        ).transact(tx)
         receipt = await self._rpc.get_tx_receipt(tx_hash)
-        assert await self._contract.functions.allowance(spender, token).call() == amount
+        # A successful receipt proves the allowance was written, no need to read it
+        # back: overlapping that read with the receipt wait could observe pre-tx state
+        assert receipt["status"] == 1
         return receipt
 
     async def owner(self) -> ChecksumAddress:
@@ -70,7 +90,8 @@ class InfernetWallet:
         Returns:
             The address of the owner
         """
-        return Web3.to_checksum_address(await self._contract.functions.owner().call())
+        # web3py already decodes `address` outputs as checksum addresses
+        return cast(ChecksumAddress, await self._contract.functions.owner().call())
 
     async def get_balance(self) -> int:
         """
@@ -91,19 +112,52 @@ class InfernetWallet:
         Returns:
             The balance of the token
         """
-        return await Token(token, self._rpc).balance_of(self.address)
+        if token not in self._tokens:
+            self._tokens[token] = Token(token, self._rpc)
+        return await self._tokens[token].balance_of(self.address)
+
+    async def get_token_balances(
+        self, tokens: list[ChecksumAddress]
+    ) -> dict[ChecksumAddress, int]:
+        """
+        Get the balances of many tokens in the wallet. All `balanceOf` reads are
+        aggregated into a single `eth_call` to the `Multicall3` contract, which must be
+        deployed on the connected chain
+
+        Args:
+            tokens: The addresses of the tokens
+
+        Returns:
+            The balance of each token
 
-    async def withdraw(self, token: ChecksumAddress, amount: int) -> TxReceipt:
+        Raises:
+            BadFunctionCallOutput: A token returned no (or malformed) data, e.g. it is
+                not deployed on the connected chain
+        """
+        # Every read shares the same calldata, only the target token differs
+        calldata = address_calldata(ERC20_SELECTORS["balanceOf"], self.address)
+        multicall = self._rpc.get_contract(
+            address=MULTICALL3_ADDRESS, abi=MULTICALL3_ABI
+        )
+        _, results = await multicall.functions.aggregate(
+            [(token, calldata) for token in tokens]
+        ).call()
+        return {token: uint_result(result) for token, result in zip(tokens, results)}
+
+    async def withdraw(
+        self, token: ChecksumAddress, amount: int, tx: Optional[TxParams] = None
+    ) -> TxReceipt:
         """
         Withdraw tokens not locked in escrow. Only usable by wallet owner
 
         Args:
             token: The address of the token
             amount: The amount to withdraw
+            tx: Transaction parameters, e.g. from `RPC.get_transaction_params()`
 
         Returns:
             The transaction receipt
         """
-        tx_hash = await self._contract.functions.withdraw(token, amount).transact()
+        tx_hash = await self._contract.functions.withdraw(token, amount).transact(tx)
         receipt = await self._rpc.get_tx_receipt(tx_hash)
         return receipt
@@ -9,6 +9,8 @@ The `WalletFactory` contract is responsible for creating new payment wallets for
 for the given owner.
 - `is_valid_wallet(wallet: ChecksumAddress) -> bool`: Check if a given wallet is a valid
 payment wallet.
+- `are_valid_wallets(wallets: list[ChecksumAddress]) -> dict[ChecksumAddress, bool]`:
+Check many wallets at once, in a single `Multicall3` call.
 
 ## Example Usage
 
@@ -27,14 +29,19 @@ payment wallet.
 from __future__ import annotations
 
 import logging
-from typing import cast
 
 from eth_typing import ChecksumAddress
 from web3.contract.async_contract import AsyncContractFunction
 
-from infernet_client.chain.abis import WALLET_FACTORY_ABI
+from infernet_client.chain.abis import (
+    MULTICALL3_ABI,
+    WALLET_FACTORY_ABI,
+    WALLET_FACTORY_SELECTORS,
+    address_calldata,
+    uint_result,
+)
 from infernet_client.chain.rpc import RPC
-from infernet_client.chain.wallet import InfernetWallet
+from infernet_client.chain.wallet import MULTICALL3_ADDRESS, InfernetWallet
 
 log = logging.getLogger(__name__)
 
@@ -70,10 +77,13 @@ class WalletFactory:
             InfernetWallet: Instance of the `InfernetWallet` class.
         """
         fn: AsyncContractFunction = self._contract.functions.createWallet(owner)
+        # The dry run must resolve before the transaction is sent: the predicted
+        # wallet address depends on factory state that the transaction mutates
         new_wallet: ChecksumAddress = await fn.call()
         tx_hash = await fn.transact()
-        await self._rpc.get_tx_receipt(tx_hash)
-        assert await self.is_valid_wallet(new_wallet)
+        receipt = await self._rpc.get_tx_receipt(tx_hash)
+        # A successful receipt proves creation, no need to read `isValidWallet` back
+        assert receipt["status"] == 1
         log.info(f"created payment wallet {new_wallet} tx_hash={tx_hash.hex()}")
         return InfernetWallet(new_wallet, self._rpc)
 
@@ -87,5 +97,40 @@ class WalletFactory:
 
         Returns:
             bool: True if the wallet is a valid payment wallet, False otherwise.
+
+        Raises:
+            BadFunctionCallOutput: The factory returned no (or malformed) data, e.g.
+                it is not deployed on the connected chain
+        """
+        data = address_calldata(WALLET_FACTORY_SELECTORS["isValidWallet"], wallet)
+        result = await self._rpc.call({"to": self.address, "data": data})
+        return uint_result(result) != 0
+
+    async def are_valid_wallets(
+        self, wallets: list[ChecksumAddress]
+    ) -> dict[ChecksumAddress, bool]:
+        """
+        Check if many wallets are valid payment wallets. All `isValidWallet` reads are
+        aggregated into a single `eth_call` to the `Multicall3` contract, which must be
+        deployed on the connected chain
+
+        Args:
+            wallets (list[ChecksumAddress]): Addresses of the wallets.
+
+        Returns:
+            dict[ChecksumAddress, bool]: Whether each wallet is a valid payment wallet.
+
+        Raises:
+            BadFunctionCallOutput: The factory returned no (or malformed) data, e.g.
+                it is not deployed on the connected chain
         """
-        return cast(bool, await self._contract.functions.isValidWallet(wallet).call())
+        selector = WALLET_FACTORY_SELECTORS["isValidWallet"]
+        multicall = self._rpc.get_contract(
+            address=MULTICALL3_ADDRESS, abi=MULTICALL3_ABI
+        )
+        _, results = await multicall.functions.aggregate(
+            [(self.address, address_calldata(selector, wallet)) for wallet in wallets]
+        ).call()
+        return {
+            wallet: uint_result(result) != 0 for wallet, result in zip(wallets, results)
+        }
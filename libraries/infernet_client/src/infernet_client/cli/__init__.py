@@ -1,31 +1,220 @@
+from __future__ import annotations
+
 import asyncio
 import json
-from typing import IO, Optional, cast
+from functools import partial
+from inspect import signature
+from typing import IO, TYPE_CHECKING, Any, Callable, Coroutine, Optional, TypeVar, cast
 
 import click
-from web3 import Web3
-from web3.types import TxReceipt
-
-from infernet_client.chain.rpc import RPC
-from infernet_client.chain.subscription import Subscription
-from infernet_client.chain.token import ZERO_ADDRESS, Token
-from infernet_client.chain.wallet import InfernetWallet
-from infernet_client.chain.wallet_factory import WalletFactory
+
+from infernet_client.chain import ZERO_ADDRESS
 from infernet_client.cli.options import (
-    amount_option,
+    AddressType,
+    AmountWeiType,
+    chain_tx_options,
     input_option,
     output_option,
     output_result,
     private_key_option,
     router_url_option,
     rpc_url_option,
-    token_option,
     url_option,
-    wallet_option,
 )
 from infernet_client.node import NodeClient
 from infernet_client.router import RouterClient
-from infernet_client.types import ContainerError, ContainerOutput, JobRequest
+from infernet_client.types import (
+    ContainerError,
+    ContainerOutput,
+    JobID,
+    JobRequest,
+    JobResult,
+)
+
+# web3 and the chain modules are imported within the commands that use them, so that
+# the other commands don't pay for web3's import time
+if TYPE_CHECKING:
+    from infernet_client.chain.rpc import RPC
+
+try:
+    import uvloop  # type: ignore[import-not-found, unused-ignore]
+except ImportError:
+    uvloop = None
+
+T = TypeVar("T")
+
+# Seconds to wait before flushing streamed output, so that bursts of chunks are
+# written out together
+STREAM_FLUSH_INTERVAL = 0.01
+
+
+def _run(coro: Coroutine[Any, Any, T]) -> T:
+    """Runs a coroutine to completion, on uvloop's event loop if it is installed
+    (`pip install infernet-client[uvloop]`), otherwise on asyncio's default loop
+
+    Args:
+        coro (Coroutine[Any, Any, T]): Coroutine to run
+
+    Returns:
+        T: Result of the coroutine
+    """
+    if uvloop is not None:
+        return cast(T, uvloop.run(coro))
+    return asyncio.run(coro)
+
+
+async def _closing(
+    client: NodeClient | RouterClient, coro: Coroutine[Any, Any, T]
+) -> T:
+    """Awaits a coroutine making requests with a client, then closes the client's
+    session
+
+    Args:
+        client (NodeClient | RouterClient): Client to close
+        coro (Coroutine[Any, Any, T]): Coroutine to await
+
+    Returns:
+        T: Result of the coroutine
+    """
+    async with client:
+        return await coro
+
+
+def _request(client: NodeClient | RouterClient, coro: Coroutine[Any, Any, T]) -> T:
+    """Runs a client request to completion, closing the client's session within the
+    same event loop
+
+    Args:
+        client (NodeClient | RouterClient): Client making the request
+        coro (Coroutine[Any, Any, T]): Request coroutine
+
+    Returns:
+        T: Result of the request
+    """
+    return _run(_closing(client, coro))
+
+
+def _transact(
+    rpc_url: str,
+    private_key: str,
+    actions: list[Callable[[RPC], Coroutine[Any, Any, str]]],
+) -> None:
+    """Runs chain actions in order with one RPC client, initialized with the private
+    key, echoing each action's result as it completes
+
+    Args:
+        rpc_url (str): RPC url
+        private_key (str): Private key to sign transactions with
+        actions (list[Callable[[RPC], Coroutine[Any, Any, str]]]): Actions, each
+            returning a success message
+    """
+
+    from infernet_client.chain.rpc import RPC
+
+    async def run() -> None:
+        async with RPC(rpc_url) as rpc:
+            await rpc.initialize_with_private_key(private_key)
+            for action in actions:
+                click.echo(await action(rpc))
+
+    _run(run())
+
+
+async def _create_wallet(rpc: RPC, factory: str, owner: Optional[str] = None) -> str:
+    """Creates an Infernet wallet, see `create-wallet`"""
+
+    from infernet_client.chain.wallet_factory import WalletFactory
+
+    _factory = WalletFactory(rpc.get_checksum_address(factory), rpc)
+    # The account address is already checksummed
+    _owner = rpc.get_checksum_address(owner) if owner else rpc.account.address
+    # The wallet is created with `_owner` as its owner, and creation is checked from
+    # the receipt, so the owner needn't be read back
+    wallet = await _factory.create_wallet(_owner)
+    return f"Success: wallet created.\n\tAddress: {wallet.address}\n\tOwner: {_owner}"
+
+
+async def _approve(
+    rpc: RPC, wallet: str, spender: str, amount: int, token: str = ZERO_ADDRESS
+) -> str:
+    """Approves a spender, see `approve`"""
+
+    from infernet_client.chain.wallet import InfernetWallet
+
+    infernet_wallet = InfernetWallet(rpc.get_checksum_address(wallet), rpc)
+    receipt = await infernet_wallet.approve(
+        rpc.get_checksum_address(spender),
+        rpc.get_checksum_address(token),
+        amount,
+        await rpc.get_transaction_params(),
+    )
+    return (
+        f"Success: approved spender: {spender} for\n\tamount: {amount} wei"
+        f"\n\ttoken: {token}\n\ttx: {receipt['transactionHash'].hex()}"
+    )
+
+
+async def _fund(rpc: RPC, wallet: str, amount: int, token: str = ZERO_ADDRESS) -> str:
+    """Funds a wallet, see `fund`"""
+
+    from web3.types import Wei
+
+    from infernet_client.chain.token import Token
+
+    if token == ZERO_ADDRESS:
+        tx = await rpc.send_transaction(
+            {
+                **await rpc.get_transaction_params(),
+                "to": rpc.get_checksum_address(wallet),
+                "value": Wei(amount),
+            },
+        )
+        receipt = await rpc.get_tx_receipt(tx)
+    else:
+        token_contract = Token(rpc.get_checksum_address(token), rpc)
+        receipt = await token_contract.transfer(
+            rpc.get_checksum_address(wallet),
+            Wei(amount),
+            await rpc.get_transaction_params(),
+        )
+    return (
+        f"Success: sent\n\tamount: {amount} wei\n\ttoken: {token}\n\tto wallet: {wallet}"
+        f"\n\ttx: {receipt['transactionHash'].hex()}"
+    )
+
+
+async def _withdraw(
+    rpc: RPC, wallet: str, amount: int, token: str = ZERO_ADDRESS
+) -> str:
+    """Withdraws tokens from a wallet, see `withdraw`"""
+
+    from infernet_client.chain.wallet import InfernetWallet
+
+    infernet_wallet = InfernetWallet(rpc.get_checksum_address(wallet), rpc)
+    receipt = await infernet_wallet.withdraw(
+        rpc.get_checksum_address(token),
+        amount,
+        await rpc.get_transaction_params(),
+    )
+    return (
+        f"Success: withdrawal of amount: {amount} wei\n\ttoken: {token}"
+        f"\n\ttx: {receipt['transactionHash'].hex()}"
+    )
+
+
+# Chain actions by name, for the `do` command
+_ACTIONS: dict[str, Callable[..., Coroutine[Any, Any, str]]] = {
+    "create-wallet": _create_wallet,
+    "approve": _approve,
+    "fund": _fund,
+    "withdraw": _withdraw,
+}
+
+_AMOUNT = AmountWeiType()
+
+# Parameters of chain actions that are addresses
+_ADDRESS = AddressType()
+_ADDRESS_PARAMS = frozenset({"factory", "owner", "wallet", "spender", "token"})
 
 
 @click.group()
@@ -40,7 +229,7 @@ def cli() -> None:
 def health(url: str) -> None:
     """Health check"""
     client = NodeClient(url)
-    healthy = asyncio.run(client.health())
+    healthy = _request(client, client.health())
     if healthy:
         click.echo("healthy")
     else:
@@ -55,7 +244,7 @@ def health(url: str) -> None:
 def info(url: str, output: IO[str]) -> None:
     """Get node information."""
     client = NodeClient(url)
-    info = asyncio.run(client.get_info())
+    info = _request(client, client.get_info())
 
     # Output the information
     output_result(info, output)
@@ -79,9 +268,11 @@ def resources(url: str, output: IO[str], node: Optional[str]) -> None:
     If a node is provided, returns resources for that node. Otherwise, returns all nodes.
     """
     if node is not None:
-        output_result(asyncio.run(NodeClient(node).get_resources()), output)
+        node_client = NodeClient(node)
+        output_result(_request(node_client, node_client.get_resources()), output)
     else:
-        output_result(asyncio.run(RouterClient(url).get_resources()), output)
+        router_client = RouterClient(url)
+        output_result(_request(router_client, router_client.get_resources()), output)
 
 
 @click.option(
@@ -109,12 +300,15 @@ def model_check(model_id: str, url: str, output: IO[str], node: Optional[str]) -
     If a node is provided, returns support for that node. Otherwise, returns all nodes.
     """
     if node is not None:
+        node_client = NodeClient(node)
         output_result(
-            asyncio.run(NodeClient(node).check_model_support(model_id)), output
+            _request(node_client, node_client.check_model_support(model_id)), output
         )
     else:
+        router_client = RouterClient(url)
         output_result(
-            asyncio.run(RouterClient(url).check_model_support(model_id)), output
+            _request(router_client, router_client.check_model_support(model_id)),
+            output,
         )
 
 
@@ -166,16 +360,22 @@ def request_job(
         containers=containers.split(","), data=data, requires_proof=requires_proof
     )
 
-    # Request the job
-    job_id = asyncio.run(client.request_job(request))
+    # Request the job, and if sync is enabled wait for it to complete, within one
+    # event loop so that polls reuse the request's connection
+    async def _request_job() -> tuple[JobID, Optional[JobResult]]:
+        async with client:
+            job_id = await client.request_job(request)
+            if not sync:
+                return job_id, None
+            return job_id, await client.get_job_result_sync(job_id, retries=retries)
+
+    job_id, job = _run(_request_job())
 
     # By default, return the job ID
     result = job_id
 
-    # If sync is enabled, wait for job to complete and return results instead
+    # If sync is enabled, return results instead
     if sync:
-        job = asyncio.run(client.get_job_result_sync(job_id, retries=retries))
-
         if not job:
             click.echo("Job not found.")
             return
@@ -215,26 +415,49 @@ def request_stream(url: str, container: str, input: IO[str], output: IO[str]) ->
 
     # Create an iterator from the async generator
     async def get_bytes() -> None:
+        loop = asyncio.get_running_loop()
+        flush: Optional[asyncio.TimerHandle] = None
+
+        def _flush() -> None:
+            nonlocal flush
+            flush = None
+            output.flush()
+
+        # Write output bytes straight to the binary stream underneath the text
+        # wrapper when there is one, rather than decoding them only to re-encode
+        buffer = cast(Optional[IO[bytes]], getattr(output, "buffer", None))
+
         job_id = None
         async for chunk in stream:
             # First bytes is the job ID
             if not job_id:
                 job_id = str(chunk)
                 click.echo(f"Job ID: {job_id}")
+                # Anything already written to the text layer must precede the
+                # output bytes
+                output.flush()
                 continue
 
             # Subsequent bytes are output, so write to output file.
-            if isinstance(chunk, bytes):
+            if buffer is not None:
+                buffer.write(chunk if isinstance(chunk, bytes) else chunk.encode())
+            elif isinstance(chunk, bytes):
                 output.write(chunk.decode("utf-8"))
             else:
                 output.write(chunk)
 
-            # Flush for stream-like behavior
-            output.flush()
+            # Flush for stream-like behavior, coalescing chunks that arrive in
+            # quick succession into a single flush
+            if flush is None:
+                flush = loop.call_later(STREAM_FLUSH_INTERVAL, _flush)
+
+        if flush is not None:
+            flush.cancel()
+        output.flush()
         output.write("\n")
 
     # Output result
-    asyncio.run(get_bytes())
+    _run(_closing(client, get_bytes()))
 
 
 @click.option(
@@ -261,7 +484,7 @@ def get_results(
     client = NodeClient(url)
 
     # Get the job results
-    results = asyncio.run(client.get_job_results(id, intermediate))
+    results = _request(client, client.get_job_results(id, intermediate))
 
     # Output the results
     output_result(results, output)
@@ -285,7 +508,7 @@ def get_jobs(url: str, output: IO[str], status: str) -> None:
 
     # Get the job results
     pending = True if status == "pending" else False if status == "completed" else None
-    results = asyncio.run(client.get_jobs(pending))
+    results = _request(client, client.get_jobs(pending))
 
     # Output the results
     output_result(results, output)
@@ -345,6 +568,9 @@ def request_subscription(
     Delegated subscriptions deliver results to a user-defined contract on-chain.
     """
 
+    from infernet_client.chain.rpc import RPC
+    from infernet_client.chain.subscription import Subscription
+
     # Load the input data and private key
     data = json.load(input)
     private_key = key.read().strip()
@@ -353,21 +579,22 @@ def request_subscription(
     subscription_params = json.load(params)
     subscription = Subscription(**subscription_params)
 
-    # Initialize the client and RPC
+    # Initialize the client
     client = NodeClient(url)
-    rpc = RPC(rpc_url)
-
-    asyncio.run(
-        client.request_delegated_subscription(
-            subscription,
-            rpc,
-            rpc.get_checksum_address(address),
-            expiry,
-            nonce,
-            private_key,
-            data,
-        )
-    )
+
+    async def _request() -> None:
+        async with RPC.readonly(rpc_url) as rpc:
+            await client.request_delegated_subscription(
+                subscription,
+                rpc,
+                rpc.get_checksum_address(address),
+                expiry,
+                nonce,
+                private_key,
+                data,
+            )
+
+    _run(_closing(client, _request()))
 
     click.echo("Success: Subscription created.")
 
@@ -413,24 +640,12 @@ def create_infernet_wallet(
             --factory 0xF6168876932289D073567f347121A267095f3DD6
     """  # noqa: E501
 
-    async def create_wallet() -> InfernetWallet:
-        rpc = RPC(rpc_url)
-        await rpc.initialize_with_private_key(private_key)
-        _factory = WalletFactory(Web3.to_checksum_address(factory), rpc)
-        _default_owner = Web3.to_checksum_address(rpc.account.address)  # type: ignore
-        _owner = owner if owner else _default_owner
-        return await _factory.create_wallet(Web3.to_checksum_address(_owner))
-
-    wallet = asyncio.run(create_wallet())
-    owner = asyncio.run(wallet.owner())
-    click.echo(
-        f"Success: wallet created.\n\tAddress: {wallet.address}\n\tOwner: {owner}"
+    _transact(
+        rpc_url, private_key, [partial(_create_wallet, factory=factory, owner=owner)]
     )
 
 
-@token_option
-@wallet_option
-@amount_option
+@chain_tx_options
 @click.option(
     "-s",
     "--spender",
@@ -438,8 +653,6 @@ def create_infernet_wallet(
     type=str,
     help="Address of spender to approve for spending.",
 )
-@rpc_url_option
-@private_key_option
 @cli.command(
     name="approve",
 )
@@ -449,7 +662,7 @@ def approve_spender(
     wallet: str,
     spender: str,
     token: str,
-    amount: str,
+    amount: int,
 ) -> None:
     """Approve a spender.
 
@@ -462,35 +675,14 @@ def approve_spender(
             --amount '1 ether'
     """  # noqa: E501"""
 
-    async def _approve() -> TxReceipt:
-        rpc = RPC(rpc_url)
-        await rpc.initialize_with_private_key(private_key)
-        infernet_wallet = InfernetWallet(
-            Web3.to_checksum_address(wallet),
-            rpc,
-        )
-        _split = amount.split(" ")
-        # if no denomination provided, use token decimals
-        n, u = _split if len(_split) == 2 else (amount, "wei")
-        amount_int = Web3.to_wei(n, u)
-        return await infernet_wallet.approve(
-            Web3.to_checksum_address(spender),
-            Web3.to_checksum_address(token),
-            amount_int,
-        )
-
-    receipt = asyncio.run(_approve())
-    click.echo(
-        f"Success: approved spender: {spender} for\n\tamount: {amount}\n\ttoken: {token}"
-        f"\n\ttx: {receipt['transactionHash'].hex()}"
+    _transact(
+        rpc_url,
+        private_key,
+        [partial(_approve, wallet=wallet, spender=spender, amount=amount, token=token)],
     )
 
 
-@token_option
-@wallet_option
-@amount_option
-@rpc_url_option
-@private_key_option
+@chain_tx_options
 @cli.command(
     name="fund",
 )
@@ -499,7 +691,7 @@ def fund_wallet(
     private_key: str,
     wallet: str,
     token: str,
-    amount: str,
+    amount: int,
 ) -> None:
     """Fund a wallet.
 
@@ -510,33 +702,10 @@ def fund_wallet(
             --amount '1 ether'
     """  # noqa: E501"""
 
-    async def _fund() -> TxReceipt:
-        rpc = RPC(rpc_url)
-        await rpc.initialize_with_private_key(private_key)
-        _split = amount.split(" ")
-        # if no denomination provided, use token decimals
-        n, u = _split if len(_split) == 2 else (amount, "wei")
-        amount_int = Web3.to_wei(n, u)
-
-        if token == ZERO_ADDRESS:
-            tx = await rpc.send_transaction(
-                {
-                    "to": Web3.to_checksum_address(wallet),
-                    "value": amount_int,
-                },
-            )
-            return await rpc.get_tx_receipt(tx)
-
-        token_contract = Token(Web3.to_checksum_address(token), rpc)
-        return await token_contract.transfer(
-            Web3.to_checksum_address(wallet),
-            amount_int,
-        )
-
-    receipt = asyncio.run(_fund())
-    click.echo(
-        f"Success: sent\n\tamount: {amount}\n\ttoken: {token}\n\tto wallet: {wallet}"
-        f"\n\ttx: {receipt['transactionHash'].hex()}"
+    _transact(
+        rpc_url,
+        private_key,
+        [partial(_fund, wallet=wallet, amount=amount, token=token)],
     )
 
 
@@ -547,7 +716,7 @@ def fund_wallet(
 def get_containers(url: str) -> None:
     """List containers running in the network"""
     client = RouterClient(url)
-    containers = asyncio.run(client.get_containers())
+    containers = _request(client, client.get_containers())
     click.echo(json.dumps(containers, indent=2))
 
 
@@ -565,15 +734,11 @@ def get_containers(url: str) -> None:
 def find_nodes(c: list[str], n: int, skip: int, url: str) -> None:
     """Find nodes running the given containers"""
     client = RouterClient(url)
-    nodes = asyncio.run(client.get_nodes_by_container_ids(c, n, skip))
+    nodes = _request(client, client.get_nodes_by_container_ids(c, n, skip))
     click.echo(json.dumps(nodes, indent=2))
 
 
-@token_option
-@wallet_option
-@amount_option
-@rpc_url_option
-@private_key_option
+@chain_tx_options
 @cli.command(
     name="withdraw",
 )
@@ -582,7 +747,7 @@ def withdraw(
     private_key: str,
     wallet: str,
     token: str,
-    amount: str,
+    amount: int,
 ) -> None:
     """Withdraw tokens.
 
@@ -596,24 +761,62 @@ def withdraw(
             --amount '1 ether'
     """  # noqa: E501
 
-    async def _withdraw() -> TxReceipt:
-        rpc = RPC(rpc_url)
-        await rpc.initialize_with_private_key(private_key)
-        infernet_wallet = InfernetWallet(
-            Web3.to_checksum_address(wallet),
-            rpc,
-        )
-        _split = amount.split(" ")
-        # if no denomination provided, use token decimals
-        n, u = _split if len(_split) == 2 else (amount, "wei")
-        amount_int = Web3.to_wei(n, u)
-        return await infernet_wallet.withdraw(
-            Web3.to_checksum_address(token),
-            amount_int,
-        )
-
-    receipt = asyncio.run(_withdraw())
-    click.echo(
-        f"Success: withdrawal of amount: {amount}\n\ttoken: {token}"
-        f"\n\ttx: {receipt['transactionHash'].hex()}"
+    _transact(
+        rpc_url,
+        private_key,
+        [partial(_withdraw, wallet=wallet, amount=amount, token=token)],
     )
+
+
+@input_option
+@rpc_url_option
+@private_key_option
+@cli.command(
+    name="do",
+)
+def do(rpc_url: str, private_key: str, input: IO[str]) -> None:
+    """Run chain actions in order, over one RPC connection.
+
+    Reads a JSON list of steps. Each step has an `action`, one of create-wallet,
+    approve, fund or withdraw, along with that command's options. The actions and
+    the amounts and addresses of all steps are validated before the first one is
+    sent.
+
+    Example:
+        echo '[
+            {"action": "fund", "wallet": "0x7749f632935738EA2Dd32EBEcbb8B9145E1efeF6",
+             "amount": "1 ether"},
+            {"action": "approve", "wallet": "0x7749f632935738EA2Dd32EBEcbb8B9145E1efeF6",
+             "spender": "0x3C44CdDdB6a900fa2b585dd299e03d12FA4293BC",
+             "amount": "1 ether"}
+        ]' | infernet-client do --rpc-url http://localhost:8545 \
+            --private-key 0x5de4111afa1a4b94908f83103eb1f1706367c2e68ca870fc3fb9a804cdab365a
+    """  # noqa: E501
+
+    steps = json.load(input)
+    if not isinstance(steps, list):
+        raise click.BadParameter("Expected a JSON list of steps.", param_hint="input")
+
+    actions: list[Callable[[RPC], Coroutine[Any, Any, str]]] = []
+    for i, step in enumerate(steps):
+        params = dict(step) if isinstance(step, dict) else {}
+        action = _ACTIONS.get(params.pop("action", None))
+        if action is None:
+            raise click.BadParameter(
+                f"Step {i}: expected an action, one of {', '.join(_ACTIONS)}.",
+                param_hint="input",
+            )
+        try:
+            if "amount" in params:
+                params["amount"] = _AMOUNT.convert(params["amount"], None, None)
+            for name in sorted(_ADDRESS_PARAMS.intersection(params)):
+                params[name] = _ADDRESS.convert(params[name], None, None)
+            signature(action).bind(None, **params)
+        except (click.BadParameter, TypeError) as e:
+            raise click.BadParameter(
+                f"Step {i}: {e.message if isinstance(e, click.BadParameter) else e}",
+                param_hint="input",
+            ) from e
+        actions.append(partial(action, **params))
+
+    _transact(rpc_url, private_key, actions)
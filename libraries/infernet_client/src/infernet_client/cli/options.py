@@ -1,9 +1,10 @@
 import json
-from typing import IO, Any, Callable
+from typing import IO, Any, Callable, Optional
 
 import click
+import orjson
 
-from infernet_client.chain.token import ZERO_ADDRESS
+from infernet_client.chain import ZERO_ADDRESS
 
 # Generic callable type for function decorators
 GenericCallable = Callable[..., Any]
@@ -45,13 +46,79 @@ def token_option(f: GenericCallable) -> GenericCallable:
     )(f)
 
 
+class AmountWeiType(click.ParamType):
+    """Amount, parsed into wei. Either a number of wei i.e. 100, or a number and a
+    denomination: i.e. '1 ether', '100 gwei', etc."""
+
+    name = "amount"
+
+    def convert(
+        self, value: Any, param: Optional[click.Parameter], ctx: Optional[click.Context]
+    ) -> int:
+        amount = self._parse(value, param, ctx)
+        # Same range as `to_wei`, which the plain integer paths skip
+        if not 0 <= amount < 2**256:
+            self.fail(
+                f"{value!r} is not a valid amount: Resulting wei value must be "
+                "between 0 and 2**256 - 1",
+                param,
+                ctx,
+            )
+        return amount
+
+    def _parse(
+        self, value: Any, param: Optional[click.Parameter], ctx: Optional[click.Context]
+    ) -> int:
+        # Amounts from JSON (see `do`) can be of any type, bools are ints too
+        if isinstance(value, bool) or not isinstance(value, (str, int)):
+            self.fail(f"{value!r} is not a valid amount", param, ctx)
+        if isinstance(value, int):
+            return value
+
+        n, _, unit = value.partition(" ")
+        if not unit:
+            # Plain integers are already in wei
+            try:
+                return int(n)
+            except ValueError:
+                pass
+
+        # eth-utils is only needed for denominated or fractional amounts
+        from eth_utils.currency import to_wei
+
+        try:
+            return int(to_wei(n, unit or "wei"))
+        except (ValueError, ArithmeticError) as e:
+            self.fail(f"{value!r} is not a valid amount: {e}", param, ctx)
+
+
+class AddressType(click.ParamType):
+    """Hex address, parsed into its checksummed form"""
+
+    name = "address"
+
+    def convert(
+        self, value: Any, param: Optional[click.Parameter], ctx: Optional[click.Context]
+    ) -> str:
+        if not isinstance(value, str):
+            self.fail(f"{value!r} is not a valid address", param, ctx)
+
+        # eth-utils is only needed once an address is given
+        from eth_utils.address import to_checksum_address
+
+        try:
+            return to_checksum_address(value)
+        except ValueError as e:
+            self.fail(f"{value!r} is not a valid address: {e}", param, ctx)
+
+
 def amount_option(f: GenericCallable) -> GenericCallable:
     """Decorator to add a amount option to a command."""
     return click.option(
         "-a",
         "--amount",
         required=True,
-        type=str,
+        type=AmountWeiType(),
         help="Amount to approve for spending. Either provide a number i.e. 100 or a "
         "number and a denomination: i.e. '1 ether', '100 gwei', etc.",
     )(f)
@@ -104,6 +171,16 @@ def private_key_option(f: GenericCallable) -> GenericCallable:
     )(f)
 
 
+def chain_tx_options(f: GenericCallable) -> GenericCallable:
+    """Decorator to add the options shared by commands that send a token transaction:
+    token, wallet, amount, rpc url and private key."""
+    for option in reversed(
+        (token_option, wallet_option, amount_option, rpc_url_option, private_key_option)
+    ):
+        f = option(f)
+    return f
+
+
 def input_option(f: GenericCallable) -> GenericCallable:
     """Decorator to add an input option to a command."""
     return click.option(
@@ -132,5 +209,21 @@ def output_result(result: Any, output: IO[str]) -> None:
     if isinstance(result, str):
         output.write(result)
     else:
-        json.dump(result, output, indent=2)
+        try:
+            data = orjson.dumps(result, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            # orjson only handles 64-bit integers, e.g. token amounts can overflow.
+            # Results are parsed JSON, so they can't be circular
+            json.dump(
+                result, output, indent=2, ensure_ascii=False, check_circular=False
+            )
+        else:
+            # Write orjson's UTF-8 straight to the binary stream underneath the text
+            # wrapper when there is one, rather than decoding it only to re-encode
+            buffer = getattr(output, "buffer", None)
+            if buffer is None:
+                output.write(data.decode())
+            else:
+                output.flush()
+                buffer.write(data)
     output.write("\n")
@@ -0,0 +1,100 @@
+"""Module containing the BaseClient class, the HTTP session and response caching
+shared by `NodeClient` and `RouterClient`.
+"""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from time import monotonic
+from typing import Any, AsyncIterator, Optional, TypeVar
+
+from aiohttp import ClientSession, ClientTimeout
+
+_ClientT = TypeVar("_ClientT", bound="BaseClient")
+
+
+class BaseClient:
+    def __init__(self, base_url: str, cache_ttl: float = 0):
+        """Initializes the client
+
+        Args:
+            base_url (str): The base URL of the REST server
+            cache_ttl (float, optional): How long, in seconds, to reuse cached
+                responses. Defaults to 0, i.e. no caching.
+
+        """
+        self.base_url = base_url
+        self.cache_ttl = cache_ttl
+        self._cache: dict[str, tuple[float, Any]] = {}
+        self._session: Optional[ClientSession] = None
+
+    def _new_session(self) -> ClientSession:
+        """Opens a new HTTP session to send requests with
+
+        Returns:
+            ClientSession: The new session
+        """
+        return ClientSession()
+
+    @asynccontextmanager
+    async def _get_session(self) -> AsyncIterator[ClientSession]:
+        """Yields the session to send a request with. Inside `async with`, requests
+        share the client's session, so that connections to the server are kept
+        alive and reused. Otherwise, each request opens its own session, closed once
+        the request is done
+
+        Yields:
+            ClientSession: The session to send a request with
+        """
+        if self._session is not None and not self._session.closed:
+            yield self._session
+        else:
+            async with self._new_session() as session:
+                yield session
+
+    async def aclose(self) -> None:
+        """Closes the client's session, along with its connections to the server"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def clear_cache(self) -> None:
+        """Clears cached responses, so that the next requests fetch fresh data"""
+        self._cache.clear()
+
+    async def _get_cached(self, url: str, timeout: int) -> Any:
+        """Fetches a JSON response, reusing a previous one for the same URL if it is
+        younger than the client's `cache_ttl`
+
+        Args:
+            url (str): The URL to fetch
+            timeout (int): The timeout for the request
+
+        Returns:
+            Any: The response's JSON body
+
+        Raises:
+            aiohttp.ClientResponseError: If the request returns an error code
+            aiohttp.TimeoutError: If the request times out
+        """
+        cached = self._cache.get(url)
+        if cached is not None and monotonic() - cached[0] < self.cache_ttl:
+            return cached[1]
+
+        async with self._get_session() as session, session.get(
+            url, timeout=ClientTimeout(total=timeout)
+        ) as response:
+            response.raise_for_status()
+            body = await response.json()
+
+        if self.cache_ttl > 0:
+            self._cache[url] = (monotonic(), body)
+        return body
+
+    async def __aenter__(self: _ClientT) -> _ClientT:
+        if self._session is None or self._session.closed:
+            self._session = self._new_session()
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        await self.aclose()
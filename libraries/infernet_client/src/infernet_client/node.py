@@ -8,26 +8,31 @@ You can use the Node client as follows:
 ``` python
 from infernet_client import NodeClient
 
-client = NodeClient("http://localhost:8000")
+async with NodeClient("http://localhost:8000") as client:
+    # Check the node's health
+    await client.health()
 
-# Check the node's health
-client.health()
-
-# Get information about the node
-client.get_info()
+    # Get information about the node
+    await client.get_info()
 ```
+
+Inside the `async with` block, requests share one HTTP session, which is closed on
+exiting the block (or with `aclose()`). A client used without `async with` opens a
+session per request instead.
 """
 
-from asyncio import sleep
-from typing import Any, AsyncGenerator, Optional, Union, cast
+from __future__ import annotations
+
+import json
+from asyncio import Semaphore, gather, sleep
+from random import uniform
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Optional, Union, cast
 
-from aiohttp import ClientResponseError, ClientSession, ClientTimeout
-from eth_account import Account
+import orjson
+from aiohttp import ClientResponse, ClientResponseError, ClientSession, ClientTimeout
 from eth_typing import ChecksumAddress
-from infernet_ml.utils.spec import ServiceResources
 
-from .chain.rpc import RPC
-from .chain.subscription import Subscription
+from .client import BaseClient
 from .error import APIError
 from .types import (
     ErrorResponse,
@@ -41,16 +46,129 @@ from .types import (
     NodeInfo,
 )
 
+# Imported for typing only: web3 and infernet-ml are slow to import, and only the
+# delegated subscription path needs them at runtime
+if TYPE_CHECKING:
+    from eth_keys.datatypes import PrivateKey
+    from infernet_ml.utils.spec import ServiceResources
+
+    from .chain.rpc import RPC
+    from .chain.subscription import Subscription
+
+# Initial and maximum intervals, in seconds, between polls for a job's result
+JOB_POLL_INTERVAL = 0.05
+JOB_POLL_INTERVAL_MAX = 1.0
+
+# Fraction by which poll intervals are randomly stretched or shrunk
+JOB_POLL_JITTER = 0.2
+
+# Maximum number of job IDs to request results for in a single request
+JOB_RESULTS_BATCH_SIZE = 100
+
+# Maximum number of concurrent job result requests
+JOB_RESULTS_CONCURRENCY = 32
+
+
+def _json_dumps(obj: Any) -> str:
+    """Serializes request bodies with orjson, falling back to the standard library
+    for what orjson can't encode
+
+    Args:
+        obj (Any): The request body
+
+    Returns:
+        str: The JSON-encoded request body
+    """
+    try:
+        return orjson.dumps(obj).decode()
+    except orjson.JSONEncodeError:
+        # orjson only handles 64-bit integers, e.g. payment amounts in wei can overflow
+        return json.dumps(obj)
+
+
+def _api_error(status: int, body: Any) -> APIError:
+    """Builds the error for an error response from the server
+
+    Args:
+        status (int): The response's status code
+        body (Any): The response's JSON body
+
+    Returns:
+        APIError: The error, with the server's message and parameters
+    """
+    return APIError(
+        status, body.get("error", "Unknown error"), body.get("params", None)
+    )
+
+
+async def _read_json(response: ClientResponse) -> Any:
+    """Reads a response's JSON body, raising the server's error if the response has
+    an error code
+
+    Args:
+        response (ClientResponse): The response
 
-class NodeClient:
-    def __init__(self, base_url: str):
+    Returns:
+        Any: The response's JSON body
+
+    Raises:
+        APIError: If the response has an error code
+    """
+    body = await response.json()
+    try:
+        response.raise_for_status()
+    except ClientResponseError as e:
+        raise _api_error(e.status, body) from e
+    return body
+
+
+class NodeClient(BaseClient):
+    def __init__(self, base_url: str, cache_ttl: float = 0):
         """Initializes the client
 
         Args:
             base_url (str): The base URL of the REST server
+            cache_ttl (float, optional): How long, in seconds, to reuse responses
+                that change rarely (node info and resources), rather than requesting
+                them again. Cached responses are shared between calls, so they
+                should not be modified. Defaults to 0, i.e. no caching.
+
+        """
+        super().__init__(base_url, cache_ttl)
+        self._signing_keys: dict[str, PrivateKey] = {}
 
+    def _new_session(self) -> ClientSession:
+        """Opens a new HTTP session, which serializes request bodies with orjson
+
+        Returns:
+            ClientSession: The new session
         """
-        self.base_url = base_url
+        return ClientSession(json_serialize=_json_dumps)
+
+    def clear_cache(self) -> None:
+        """Clears cached responses, so that the next requests fetch fresh data, along
+        with parsed signing keys"""
+        super().clear_cache()
+        self._signing_keys.clear()
+
+    def _signing_key(self, private_key: str) -> PrivateKey:
+        """Returns the signing key of a private key. Parsing a private key derives its
+        public key, which takes as long as signing itself, so keys are parsed once per
+        client. `clear_cache()` drops them
+
+        Args:
+            private_key (str): The private key
+
+        Returns:
+            PrivateKey: The signing key
+        """
+        from eth_keys.datatypes import PrivateKey
+        from hexbytes import HexBytes
+
+        key = self._signing_keys.get(private_key)
+        if key is None:
+            key = self._signing_keys[private_key] = PrivateKey(HexBytes(private_key))
+        return key
 
     async def health(self, timeout: int = 1) -> bool:
         """Server health check
@@ -67,13 +185,12 @@ class NodeClient:
         """
 
         url = f"{self.base_url}/health"
-        async with ClientSession() as session:
-            async with session.get(
-                url, timeout=ClientTimeout(total=timeout)
-            ) as response:
-                response.raise_for_status()
-                body = cast(HealthInfo, await response.json())
-                return body["status"] == "healthy"
+        async with self._get_session() as session, session.get(
+            url, timeout=ClientTimeout(total=timeout)
+        ) as response:
+            response.raise_for_status()
+            body = cast(HealthInfo, await response.json())
+            return body["status"] == "healthy"
 
     async def get_info(self, timeout: int = 1) -> NodeInfo:
         """Retrieves node info
@@ -93,12 +210,7 @@ class NodeClient:
         """
 
         url = f"{self.base_url}/info"
-        async with ClientSession() as session:
-            async with session.get(
-                url, timeout=ClientTimeout(total=timeout)
-            ) as response:
-                response.raise_for_status()
-                return cast(NodeInfo, await response.json())
+        return cast(NodeInfo, await self._get_cached(url, timeout))
 
     async def get_resources(self, timeout: int = 1) -> dict[str, ServiceResources]:
         """Collects container resources on the node
@@ -113,12 +225,7 @@ class NodeClient:
         """  # noqa: E501
 
         url = f"{self.base_url}/resources"
-        async with ClientSession() as session:
-            async with session.get(
-                url, timeout=ClientTimeout(total=timeout)
-            ) as response:
-                response.raise_for_status()
-                return cast(dict[str, ServiceResources], await response.json())
+        return cast("dict[str, ServiceResources]", await self._get_cached(url, timeout))
 
     async def check_model_support(
         self, model_id: str, timeout: int = 1
@@ -138,12 +245,11 @@ class NodeClient:
         """
 
         url = f"{self.base_url}/resources?model_id={model_id}"
-        async with ClientSession() as session:
-            async with session.get(
-                url, timeout=ClientTimeout(total=timeout)
-            ) as response:
-                response.raise_for_status()
-                return cast(dict[str, ModelSupport], await response.json())
+        async with self._get_session() as session, session.get(
+            url, timeout=ClientTimeout(total=timeout)
+        ) as response:
+            response.raise_for_status()
+            return cast(dict[str, ModelSupport], await response.json())
 
     async def request_job(self, job: JobRequest, timeout: int = 5) -> JobID:
         """Requests an asynchronous job
@@ -164,22 +270,12 @@ class NodeClient:
         """
 
         url = f"{self.base_url}/api/jobs"
-        async with ClientSession() as session:
-            async with session.post(
-                url,
-                json=job,
-                timeout=ClientTimeout(total=timeout),
-            ) as response:
-                body = await response.json()
-                try:
-                    response.raise_for_status()
-                    return cast(JobID, body["id"])
-                except ClientResponseError as e:
-                    raise APIError(
-                        e.status,
-                        body.get("error", "Unknown error"),
-                        body.get("params", None),
-                    ) from e
+        async with self._get_session() as session, session.post(
+            url,
+            json=job,
+            timeout=ClientTimeout(total=timeout),
+        ) as response:
+            return cast(JobID, (await _read_json(response))["id"])
 
     async def request_jobs(
         self, jobs: list[JobRequest], timeout: int = 10
@@ -209,25 +305,22 @@ class NodeClient:
         """
 
         url = f"{self.base_url}/api/jobs/batch"
-        async with ClientSession() as session:
-            async with session.post(
-                url,
-                json=jobs,
-                timeout=ClientTimeout(total=timeout),
-            ) as response:
-                body = await response.json()
-                try:
-                    response.raise_for_status()
-                    return cast(list[Union[JobResponse, ErrorResponse]], body)
-                except ClientResponseError as e:
-                    raise APIError(
-                        e.status,
-                        body.get("error", "Unknown error"),
-                        body.get("params", None),
-                    ) from e
+        async with self._get_session() as session, session.post(
+            url,
+            json=jobs,
+            timeout=ClientTimeout(total=timeout),
+        ) as response:
+            return cast(
+                list[Union[JobResponse, ErrorResponse]], await _read_json(response)
+            )
 
     async def get_job_result_sync(
-        self, job_id: JobID, retries: int = 5, timeout: int = 5
+        self,
+        job_id: JobID,
+        retries: int = 5,
+        timeout: int = 5,
+        poll_interval: float = JOB_POLL_INTERVAL,
+        max_poll_interval: float = JOB_POLL_INTERVAL_MAX,
     ) -> Optional[JobResult]:
         """Retrieves job result synchronously
 
@@ -237,8 +330,15 @@ class NodeClient:
         Args:
             job_id (JobID): The job ID
             retries (int, optional): The number of retries if the job is still running.
-                Each retry waits for 1 second before polling again. Defaults to 5.
+                Each retry accounts for 1 second of waiting, so the job is waited on
+                for `retries` seconds. Defaults to 5.
             timeout (int, optional): The timeout for the request. Defaults to 5.
+            poll_interval (float, optional): The initial interval between polls, in
+                seconds. It doubles after each poll, so that short jobs are picked up
+                promptly. Intervals vary randomly by up to `JOB_POLL_JITTER`. Defaults
+                to `JOB_POLL_INTERVAL`.
+            max_poll_interval (float, optional): The maximum interval between polls,
+                in seconds. Defaults to `JOB_POLL_INTERVAL_MAX`.
 
         Returns:
             Optional[JobResult]: The job result, or None if the job is not found
@@ -250,36 +350,112 @@ class NodeClient:
                 retries
         """
 
-        status = "running"
-        for _ in range(retries):
+        waited = 0.0
+        interval = poll_interval
+        while True:
             job = await self.get_job_results([job_id], timeout=timeout)
 
             # If the job is not found, return None
             if len(job) == 0:
                 return None
 
-            status = job[0]["status"]
-            if status != "running":
+            if job[0]["status"] != "running":
+                return job[0]
+
+            if waited >= retries:
+                raise TimeoutError(f"Job result not available after {retries} retries")
+
+            # Wait before polling again, backing off up to the maximum interval. Jitter
+            # keeps clients that started together from polling in lockstep
+            jitter = uniform(1 - JOB_POLL_JITTER, 1 + JOB_POLL_JITTER)
+            delay = min(interval * jitter, retries - waited)
+            await sleep(delay)
+            waited += delay
+            interval = min(interval * 2, max_poll_interval)
+
+    async def get_job_results_sync(
+        self,
+        job_ids: list[JobID],
+        retries: int = 5,
+        timeout: int = 5,
+        poll_interval: float = JOB_POLL_INTERVAL,
+        max_poll_interval: float = JOB_POLL_INTERVAL_MAX,
+    ) -> list[Optional[JobResult]]:
+        """Retrieves many job results synchronously
+
+        Like `get_job_result_sync`, but polls for all jobs with one request at a time,
+        only asking for those that are still running.
+
+        Args:
+            job_ids (list[JobID]): The job IDs
+            retries (int, optional): The number of retries if any job is still running.
+                Each retry accounts for 1 second of waiting, so the jobs are waited on
+                for `retries` seconds. Defaults to 5.
+            timeout (int, optional): The timeout for each request. Defaults to 5.
+            poll_interval (float, optional): The initial interval between polls, in
+                seconds. Defaults to `JOB_POLL_INTERVAL`.
+            max_poll_interval (float, optional): The maximum interval between polls,
+                in seconds. Defaults to `JOB_POLL_INTERVAL_MAX`.
+
+        Returns:
+            list[Optional[JobResult]]: The job results, in the order of `job_ids`. A
+                result is None if its job is not found
+
+        Raises:
+            APIError: If the request returns an error code
+            aiohttp.TimeoutError: If a request times out
+            TimeoutError: If any job result is not available after the maximum number
+                of retries
+        """
+
+        results: dict[JobID, Optional[JobResult]] = {}
+        pending = set(job_ids)
+        waited = 0.0
+        interval = poll_interval
+        while pending:
+            fetched = await self.get_job_results(list(pending), timeout=timeout)
+
+            # Jobs not returned by the server are not found
+            found = {job["id"]: job for job in fetched}
+            for job_id in list(pending):
+                job = found.get(job_id)
+                if job is None or job["status"] != "running":
+                    results[job_id] = job
+                    pending.discard(job_id)
+
+            if not pending:
                 break
 
-            # Wait for 1 second before polling again
-            await sleep(1)
+            if waited >= retries:
+                raise TimeoutError(
+                    f"Results of {len(pending)} jobs not available after {retries} "
+                    "retries"
+                )
 
-        if status == "running":
-            raise TimeoutError(f"Job result not available after {retries} retries")
+            # Wait before polling again, backing off up to the maximum interval. Jitter
+            # keeps clients that started together from polling in lockstep
+            jitter = uniform(1 - JOB_POLL_JITTER, 1 + JOB_POLL_JITTER)
+            delay = min(interval * jitter, retries - waited)
+            await sleep(delay)
+            waited += delay
+            interval = min(interval * 2, max_poll_interval)
 
-        return job[0]
+        return [results[job_id] for job_id in job_ids]
 
     async def get_job_results(
         self, job_ids: list[JobID], intermediate: bool = False, timeout: int = 5
     ) -> list[JobResult]:
         """Retrieves job results
 
+        Job IDs are requested in batches of `JOB_RESULTS_BATCH_SIZE`, to keep request
+        URLs within server limits. Batches are fetched concurrently, at most
+        `JOB_RESULTS_CONCURRENCY` at a time, and their results are returned in order.
+
         Args:
             job_ids (list[JobID]): The list of job IDs
             intermediate (bool, optional): Whether to return intermediate results (only
                 applicable for when multiple containers are chained). Defaults to False.
-            timeout (int, optional): The timeout for the request. Defaults to 5.
+            timeout (int, optional): The timeout for each request. Defaults to 5.
 
         Returns:
             list[JobResult]: The list of job results
@@ -289,23 +465,49 @@ class NodeClient:
             aiohttp.TimeoutError: If the request times out
         """
 
-        url = f"{self.base_url}/api/jobs?id={'&id='.join(job_ids)}"
+        if len(job_ids) <= JOB_RESULTS_BATCH_SIZE:
+            return await self._get_job_results(job_ids, intermediate, timeout)
+
+        semaphore = Semaphore(JOB_RESULTS_CONCURRENCY)
+
+        async def _get_batch(batch: list[JobID]) -> list[JobResult]:
+            async with semaphore:
+                return await self._get_job_results(batch, intermediate, timeout)
+
+        batches = await gather(
+            *(
+                _get_batch(job_ids[i : i + JOB_RESULTS_BATCH_SIZE])
+                for i in range(0, len(job_ids), JOB_RESULTS_BATCH_SIZE)
+            )
+        )
+        return [result for batch in batches for result in batch]
+
+    async def _get_job_results(
+        self, job_ids: list[JobID], intermediate: bool, timeout: int
+    ) -> list[JobResult]:
+        """Retrieves job results in a single request
+
+        Args:
+            job_ids (list[JobID]): The list of job IDs
+            intermediate (bool): Whether to return intermediate results
+            timeout (int): The timeout for the request
+
+        Returns:
+            list[JobResult]: The list of job results
+
+        Raises:
+            aiohttp.ClientResponseError: If the request returns an error code
+            aiohttp.TimeoutError: If the request times out
+        """
+
+        url = f"{self.base_url}/api/jobs"
+        params = [("id", job_id) for job_id in job_ids]
         if intermediate:
-            url += "&intermediate=true"
-        async with ClientSession() as session:
-            async with session.get(
-                url, timeout=ClientTimeout(total=timeout)
-            ) as response:
-                body = await response.json()
-                try:
-                    response.raise_for_status()
-                    return cast(list[JobResult], body)
-                except ClientResponseError as e:
-                    raise APIError(
-                        e.status,
-                        body.get("error", "Unknown error"),
-                        body.get("params", None),
-                    ) from e
+            params.append(("intermediate", "true"))
+        async with self._get_session() as session, session.get(
+            url, params=params, timeout=ClientTimeout(total=timeout)
+        ) as response:
+            return cast(list[JobResult], await _read_json(response))
 
     async def get_jobs(
         self, pending: Optional[bool] = None, timeout: int = 5
@@ -329,12 +531,11 @@ class NodeClient:
         url = f"{self.base_url}/api/jobs"
         if pending is not None:
             url += f"?pending={str(pending).lower()}"
-        async with ClientSession() as session:
-            async with session.get(
-                url, timeout=ClientTimeout(total=timeout)
-            ) as response:
-                response.raise_for_status()
-                return cast(list[JobID], await response.json())
+        async with self._get_session() as session, session.get(
+            url, timeout=ClientTimeout(total=timeout)
+        ) as response:
+            response.raise_for_status()
+            return cast(list[JobID], await response.json())
 
     async def request_stream(
         self, job: JobRequest, timeout: int = 180
@@ -356,28 +557,21 @@ class NodeClient:
         """
 
         url = f"{self.base_url}/api/jobs/stream"
-        async with ClientSession() as session:
-            async with session.post(
-                url,
-                json=job,
-                timeout=ClientTimeout(total=timeout),
-            ) as response:
-                if response.status == 200:
-                    # The first line of the response is the job ID
-                    job_id: Optional[str] = None
-                    async for chunk in response.content.iter_any():
-                        if not job_id:
-                            job_id = chunk.decode("utf-8").strip()
-                            yield job_id
-                        else:
-                            yield chunk
-                else:
-                    body = await response.json()
-                    raise APIError(
-                        response.status,
-                        body.get("error", "Unknown error"),
-                        body.get("params", None),
-                    )
+        async with self._get_session() as session, session.post(
+            url,
+            json=job,
+            timeout=ClientTimeout(total=timeout),
+        ) as response:
+            if response.status == 200:
+                chunks = response.content.iter_any()
+                # The first line of the response is the job ID
+                async for chunk in chunks:
+                    yield chunk.decode("utf-8").strip()
+                    break
+                async for chunk in chunks:
+                    yield chunk
+            else:
+                raise _api_error(response.status, await response.json())
 
     async def record_status(
         self, id: JobID, status: JobStatus, job: JobRequest, timeout: int = 5
@@ -397,25 +591,16 @@ class NodeClient:
         """
 
         url = f"{self.base_url}/api/status"
-        async with ClientSession() as session:
-            async with session.put(
-                url,
-                json={
-                    "id": id,
-                    "status": status,
-                    **job,
-                },
-                timeout=ClientTimeout(total=timeout),
-            ) as response:
-                body = await response.json()
-                try:
-                    response.raise_for_status()
-                except ClientResponseError as e:
-                    raise APIError(
-                        e.status,
-                        body.get("error", "Unknown error"),
-                        body.get("params", None),
-                    ) from e
+        async with self._get_session() as session, session.put(
+            url,
+            json={
+                "id": id,
+                "status": status,
+                **job,
+            },
+            timeout=ClientTimeout(total=timeout),
+        ) as response:
+            await _read_json(response)
 
     async def request_delegated_subscription(
         self,
@@ -444,6 +629,8 @@ class NodeClient:
             APIError: If the request returns an error code
         """
 
+        from eth_account import Account
+
         chain_id = await rpc.get_chain_id()
 
         typed_data = subscription.get_delegate_subscription_typed_data(
@@ -452,31 +639,24 @@ class NodeClient:
             chain_id,
             coordinator_address,
         )
-        signed_message = Account.sign_message(typed_data, private_key)
+        signed_message = Account.sign_message(
+            typed_data, self._signing_key(private_key)
+        )
 
         url = f"{self.base_url}/api/jobs"
-        async with ClientSession() as session:
-            async with session.post(
-                url,
-                json={
-                    "signature": {
-                        "nonce": nonce,
-                        "expiry": expiry,
-                        "v": signed_message.v,
-                        "r": int(signed_message.r),
-                        "s": int(signed_message.s),
-                    },
-                    "subscription": subscription.serialized,
-                    "data": data,
+        async with self._get_session() as session, session.post(
+            url,
+            json={
+                "signature": {
+                    "nonce": nonce,
+                    "expiry": expiry,
+                    "v": signed_message.v,
+                    "r": int(signed_message.r),
+                    "s": int(signed_message.s),
                 },
-                timeout=ClientTimeout(total=timeout),
-            ) as response:
-                body = await response.json()
-                try:
-                    response.raise_for_status()
-                except ClientResponseError as e:
-                    raise APIError(
-                        e.status,
-                        body.get("error", "Unknown error"),
-                        body.get("params", None),
-                    ) from e
+                "subscription": subscription.serialized,
+                "data": data,
+            },
+            timeout=ClientTimeout(total=timeout),
+        ) as response:
+            await _read_json(response)
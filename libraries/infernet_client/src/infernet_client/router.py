@@ -8,35 +8,49 @@ You can use the Router client as follows:
 ``` python
 from infernet_client import RouterClient
 
-client = RouterClient()
-
-# Get a list of all containers running in the network
-containers = await client.get_containers()
-
-# Get a list of nodes that support the given container IDs
-nodes = await client.get_nodes_by_container_ids(
-    [containers[0]["id"], containers[1]["id"]]
-)
+async with RouterClient() as client:
+    # Get a list of all containers running in the network
+    containers = await client.get_containers()
+
+    # Get a list of nodes that support the given container IDs
+    nodes = await client.get_nodes_by_container_ids(
+        [containers[0]["id"], containers[1]["id"]]
+    )
 ```
+
+Inside the `async with` block, requests share one HTTP session, which is closed on
+exiting the block (or with `aclose()`). A client used without `async with` opens a
+session per request instead.
 """
 
-from typing import cast
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, cast
 
-from aiohttp import ClientSession, ClientTimeout
-from infernet_ml.utils.spec import ServiceResources
+from aiohttp import ClientTimeout
 
+from infernet_client.client import BaseClient
 from infernet_client.types import ModelSupport, NetworkContainer
 
+if TYPE_CHECKING:
+    from infernet_ml.utils.spec import ServiceResources
 
-class RouterClient:
-    def __init__(self, base_url: str = "infernet-router.ritual.net"):
+
+class RouterClient(BaseClient):
+    def __init__(
+        self, base_url: str = "infernet-router.ritual.net", cache_ttl: float = 0
+    ):
         """Initializes the client
 
         Args:
             base_url (str): The base URL of the REST server
+            cache_ttl (float, optional): How long, in seconds, to reuse responses
+                that change rarely (network containers and resources), rather than
+                requesting them again. Cached responses are shared between calls, so
+                they should not be modified. Defaults to 0, i.e. no caching.
 
         """
-        self.base_url = base_url
+        super().__init__(base_url, cache_ttl)
 
     async def get_nodes_by_container_ids(
         self, container_ids: list[str], n: int = 3, offset: int = 0
@@ -54,16 +68,15 @@ class RouterClient:
         """
 
         # add container(s) as repeated query params
-        url = (
-            f"{self.base_url}/api/v1/ips?"
-            f"{'&'.join([f'container={id}' for id in container_ids])}"
-            f"&n={n}&offset={offset}"
-        )
+        url = f"{self.base_url}/api/v1/ips"
+        params = [("container", id) for id in container_ids]
+        params += [("n", str(n)), ("offset", str(offset))]
 
-        async with ClientSession() as session:
-            async with session.get(url, timeout=ClientTimeout(total=3)) as response:
-                response.raise_for_status()
-                return cast(list[str], await response.json())
+        async with self._get_session() as session, session.get(
+            url, params=params, timeout=ClientTimeout(total=3)
+        ) as response:
+            response.raise_for_status()
+            return cast(list[str], await response.json())
 
     async def get_containers(self) -> list[NetworkContainer]:
         """Get a list of all containers running in the network
@@ -73,10 +86,7 @@ class RouterClient:
         """
 
         url = f"{self.base_url}/api/v1/containers"
-        async with ClientSession() as session:
-            async with session.get(url, timeout=ClientTimeout(total=3)) as response:
-                response.raise_for_status()
-                return cast(list[NetworkContainer], await response.json())
+        return cast(list[NetworkContainer], await self._get_cached(url, 3))
 
     async def get_resources(self) -> dict[str, dict[str, ServiceResources]]:
         """Collect resources available on the network
@@ -91,12 +101,9 @@ class RouterClient:
         """
 
         url = f"{self.base_url}/api/v1/resources"
-        async with ClientSession() as session:
-            async with session.get(url, timeout=ClientTimeout(total=3)) as response:
-                response.raise_for_status()
-                return cast(
-                    dict[str, dict[str, ServiceResources]], await response.json()
-                )
+        return cast(
+            "dict[str, dict[str, ServiceResources]]", await self._get_cached(url, 3)
+        )
 
     async def check_model_support(
         self, model_id: str
@@ -116,7 +123,8 @@ class RouterClient:
         """
 
         url = f"{self.base_url}/api/v1/resources?model_id={model_id}"
-        async with ClientSession() as session:
-            async with session.get(url, timeout=ClientTimeout(total=3)) as response:
-                response.raise_for_status()
-                return cast(dict[str, dict[str, ModelSupport]], await response.json())
+        async with self._get_session() as session, session.get(
+            url, timeout=ClientTimeout(total=3)
+        ) as response:
+            response.raise_for_status()
+            return cast(dict[str, dict[str, ModelSupport]], await response.json())
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 from typing import Any, cast
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock, create_autospec
 
+from aiohttp import ClientResponse
 from eth_typing import ChecksumAddress
 
 from infernet_client.chain.subscription import Subscription
@@ -46,6 +47,19 @@ class AsyncIterator:
             raise StopAsyncIteration
 
 
+def bind_response(method: MagicMock, response: Any) -> None:
+    """Make a mocked session method respond with the given response."""
+    method.return_value.__aenter__.return_value = response
+
+
+def create_json_response(body: Any = None, status: int = 200) -> MagicMock:
+    """Create a mock response, specced from aiohttp's, with a JSON body."""
+    response = create_autospec(ClientResponse, instance=True)
+    response.status = status
+    response.json.return_value = body
+    return cast(MagicMock, response)
+
+
 # Function to create a mock response
 def create_mock_response(
     chunks: list[bytes], status: int = 200, error: dict[str, Any] = {}
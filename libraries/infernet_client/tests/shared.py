@@ -31,3 +31,34 @@ job_request_slow = JobRequest(
     containers=["infernet-client-test"],
     data={"path": "slow"},
 )
+
+mock_info = {
+    "version": "0.3.0",
+    "chain": {
+        "enabled": False,
+        "address": "",
+    },
+    "containers": [
+        {
+            "id": "infernet-client-test",
+            "external": True,
+            "image": "ritualnetwork/infernet-client-tester:0.3.0",
+            "description": "",
+        }
+    ],
+    "pending": {
+        "offchain": 0,
+        "onchain": 0,
+    },
+}
+
+mock_containers = [
+    {"id": "hello-world", "count": 100, "description": "Hello World container"},
+    {
+        "id": "ritual-tgi-inference",
+        "count": 3,
+        "description": "Serving meta-llama/Llama-2-7b-chat-hf via TGI",
+    },
+]
+
+mock_nodes = ["167.86.78.186:4000", "84.54.13.11:4000", "37.27.106.57:4000"]
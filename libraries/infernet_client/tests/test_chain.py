@@ -0,0 +1,543 @@
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, call, patch
+
+import pytest
+from eth_abi.abi import encode
+from eth_account import Account
+from eth_account.messages import encode_typed_data
+from eth_typing import URI
+from hexbytes import HexBytes
+from web3 import Web3, WebsocketProviderV2
+from web3._utils.request import async_cache_and_return_session
+from web3.exceptions import BadFunctionCallOutput, TimeExhausted, TransactionNotFound
+from web3.types import Wei
+
+from infernet_client.chain import keccak256
+from infernet_client.chain.abis import (
+    ERC20_ABI,
+    ERC20_SELECTORS,
+    MULTICALL3_ABI,
+    WALLET_ABI,
+    WALLET_FACTORY_ABI,
+    WALLET_FACTORY_SELECTORS,
+    WALLET_SELECTORS,
+)
+from infernet_client.chain.rpc import RPC, _checksum
+from infernet_client.chain.subscription import (
+    Subscription,
+    _containers_hash,
+    _encode_string,
+)
+from infernet_client.chain.wallet import MULTICALL3_ADDRESS, InfernetWallet
+from infernet_client.chain.wallet_factory import WalletFactory
+
+ADDRESS = "0x" + "11" * 20
+
+
+def test_abi_selectors() -> None:
+    """Test that precomputed selectors match the well-known function selectors."""
+
+    assert ERC20_SELECTORS["balanceOf"].hex() == "70a08231"
+    assert ERC20_SELECTORS["transfer"].hex() == "a9059cbb"
+
+    # Every function in each ABI has a selector
+    for abi, selectors in [
+        (WALLET_FACTORY_ABI, WALLET_FACTORY_SELECTORS),
+        (WALLET_ABI, WALLET_SELECTORS),
+        (ERC20_ABI, ERC20_SELECTORS),
+    ]:
+        assert set(selectors) == {item["name"] for item in abi}
+        assert all(len(selector) == 4 for selector in selectors.values())
+
+
+def test_delegate_subscription_typed_data() -> None:
+    """Test that typed data is stable across signatures of the same subscription."""
+
+    sub = Subscription(
+        ADDRESS, 1, 2, 3, 1, ["a", "b"], False, ADDRESS, 5, ADDRESS, ADDRESS
+    )
+    assert (
+        sub.serialized["containers"]
+        == "0x0deeac3a841600829c99f8116bb997da266d4c47a720b00e6ace9594de82dd54"
+    )
+    for _ in range(2):
+        message = sub.get_delegate_subscription_typed_data(1, 2, 3, ADDRESS)  # type: ignore
+        assert (
+            message.body.hex()
+            == "079fb2d961f3709c56bf1daa8beba242e6d9a29afbe90001304996de2ac7850c"
+        )
+
+
+def test_get_checksum_address_cached() -> None:
+    """Test that checksum addresses are memoized across RPC instances."""
+
+    _checksum.cache_clear()
+    address = "0x5aaeb6053f3e94c9b9a09f33669435e7ef1beaed"
+    expected = "0x5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAed"
+
+    assert RPC("http://localhost:8545").get_checksum_address(address) == expected
+    assert RPC("http://localhost:8545").get_checksum_address(address) == expected
+    assert RPC("http://localhost:8545").get_checksum_address(expected) == expected
+    assert _checksum.cache_info().hits == 2
+
+
+def test_rpc_shares_provider_per_url() -> None:
+    """Test that RPC instances for the same endpoint share one HTTP provider."""
+
+    first, second = RPC("http://localhost:8545"), RPC("http://localhost:8545")
+    other = RPC("http://localhost:8546")
+
+    assert first._web3.provider is second._web3.provider
+    assert first._web3.provider is not other._web3.provider
+
+
+@pytest.mark.asyncio
+async def test_get_token_balances() -> None:
+    """Test that token balances are read with a single Multicall3 call."""
+
+    rpc = MagicMock()
+    wallet = InfernetWallet(ADDRESS, rpc)  # type: ignore
+    aggregate = rpc.get_contract.return_value.functions.aggregate
+    aggregate.return_value.call = AsyncMock(
+        return_value=(1, [(100).to_bytes(32, "big"), (0).to_bytes(32, "big")])
+    )
+
+    tokens = ["0x" + "22" * 20, "0x" + "33" * 20]
+    balances = await wallet.get_token_balances(tokens)  # type: ignore
+
+    assert balances == {tokens[0]: 100, tokens[1]: 0}
+    rpc.get_contract.assert_called_with(address=MULTICALL3_ADDRESS, abi=MULTICALL3_ABI)
+    calldata = ERC20_SELECTORS["balanceOf"] + encode(["address"], [ADDRESS])
+    aggregate.assert_called_once_with([(token, calldata) for token in tokens])
+
+    # A token without code returns no data, rather than a zero balance
+    aggregate.return_value.call.return_value = (1, [(100).to_bytes(32, "big"), b""])
+    with pytest.raises(BadFunctionCallOutput):
+        await wallet.get_token_balances(tokens)  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_get_token_balance_reuses_token() -> None:
+    """Test that repeated balance reads reuse the same token contract."""
+
+    rpc = MagicMock()
+    wallet = InfernetWallet(ADDRESS, rpc)  # type: ignore
+    rpc.call = AsyncMock(return_value=(100).to_bytes(32, "big"))
+
+    token = "0x" + "22" * 20
+    assert await wallet.get_token_balance(token) == 100  # type: ignore
+    assert await wallet.get_token_balance(token) == 100  # type: ignore
+
+    # One contract for the wallet, one for the token
+    assert rpc.get_contract.call_count == 2
+    rpc.call.assert_called_with(
+        {
+            "to": token,
+            "data": ERC20_SELECTORS["balanceOf"] + encode(["address"], [ADDRESS]),
+        }
+    )
+
+
+@pytest.mark.parametrize("result, expected", [(1, True), (0, False)])
+@pytest.mark.asyncio
+async def test_is_valid_wallet(result: int, expected: bool) -> None:
+    """Test that wallet validity is read with precomputed calldata."""
+
+    rpc = MagicMock()
+    rpc.call = AsyncMock(return_value=result.to_bytes(32, "big"))
+    factory = WalletFactory(ADDRESS, rpc)  # type: ignore
+
+    assert await factory.is_valid_wallet(ADDRESS) is expected  # type: ignore
+    rpc.call.assert_called_once_with(
+        {
+            "to": ADDRESS,
+            "data": WALLET_FACTORY_SELECTORS["isValidWallet"]
+            + encode(["address"], [ADDRESS]),
+        }
+    )
+
+
+@pytest.mark.asyncio
+async def test_empty_call_result_raises() -> None:
+    """Test that reads from an address without code raise rather than decode as 0."""
+
+    rpc = MagicMock()
+    rpc.call = AsyncMock(return_value=b"")
+
+    with pytest.raises(BadFunctionCallOutput):
+        await InfernetWallet(ADDRESS, rpc).get_token_balance(ADDRESS)  # type: ignore
+    with pytest.raises(BadFunctionCallOutput):
+        await WalletFactory(ADDRESS, rpc).is_valid_wallet(ADDRESS)  # type: ignore
+
+
+@pytest.mark.asyncio
+@patch("infernet_client.chain.rpc.asyncio.sleep")
+async def test_get_tx_receipt_backs_off(mock_sleep: AsyncMock) -> None:
+    """Test that receipt polling backs off until the transaction is mined."""
+
+    rpc = RPC("http://localhost:8545")
+    receipt = MagicMock()
+    with patch.object(
+        rpc._reader.eth,
+        "get_transaction_receipt",
+        AsyncMock(side_effect=[TransactionNotFound, TransactionNotFound, receipt]),
+    ):
+        assert await rpc.get_tx_receipt(HexBytes("0x01")) == receipt
+
+    assert mock_sleep.call_args_list == [call(0.25), call(0.375)]
+
+
+@pytest.mark.asyncio
+async def test_get_tx_receipt_timeout() -> None:
+    """Test that receipt polling gives up after the timeout."""
+
+    rpc = RPC("http://localhost:8545")
+    with patch.object(
+        rpc._reader.eth,
+        "get_transaction_receipt",
+        AsyncMock(side_effect=TransactionNotFound),
+    ):
+        with pytest.raises(TimeExhausted):
+            await rpc.get_tx_receipt(HexBytes("0x01"), timeout=0.01)
+
+
+@pytest.mark.parametrize(
+    "address",
+    [
+        "0x52908400098527886e0f7030069857d2e4169ee7",
+        "0x8617E340B3D01FA5F11F306F4090FD50E238070D",
+        "de709f2102306220921060314715629080e2fb77",
+        "0X27B1FDB04752BBC536007A920D24ACB045561C26",
+        "0x5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAed",
+    ],
+)
+def test_checksum_matches_web3(address: str) -> None:
+    """Test that checksumming matches web3py across prefixes and casing."""
+
+    assert _checksum(address) == Web3.to_checksum_address(address)
+
+
+def test_checksum_invalid_address() -> None:
+    """Test that invalid addresses are still rejected."""
+
+    with pytest.raises(ValueError):
+        _checksum("0x1234")
+
+
+@pytest.mark.asyncio
+async def test_initialize_with_account_shares_account() -> None:
+    """Test that RPC clients can share one account across endpoints."""
+
+    account = Account.from_key("0x" + "ab" * 32)
+    first = await RPC("http://localhost:8545").initialize_with_account(account)
+    second = await RPC("http://localhost:8546").initialize_with_private_key(
+        "0x" + "ab" * 32
+    )
+
+    assert first.account is account
+    assert second.account.address == account.address
+    assert first._web3.eth.default_account == account.address
+
+
+@pytest.mark.asyncio
+async def test_readonly_rejects_writes() -> None:
+    """Test that read-only RPC clients can't sign or send transactions."""
+
+    rpc = RPC.readonly("http://localhost:8545")
+    assert rpc._web3 is rpc._reader
+
+    with pytest.raises(ValueError):
+        await rpc.initialize_with_private_key("0x" + "ab" * 32)
+    with pytest.raises(ValueError):
+        await rpc.send_transaction({"to": ADDRESS, "value": Wei(1)})
+    with pytest.raises(ValueError):
+        rpc.account
+
+
+@pytest.mark.asyncio
+async def test_reads_skip_signing_middleware() -> None:
+    """Test that reads don't go through the signing middleware."""
+
+    rpc = RPC("http://localhost:8545")
+    default_middleware = len(list(rpc._web3.middleware_onion))
+    await rpc.initialize_with_private_key("0x" + "ab" * 32)
+
+    assert len(list(rpc._web3.middleware_onion)) == default_middleware + 1
+    assert len(list(rpc._reader.middleware_onion)) == default_middleware
+
+
+@pytest.mark.asyncio
+async def test_approve_checks_receipt_status() -> None:
+    """Test that approvals are verified from the receipt, without reading back."""
+
+    rpc = MagicMock()
+    rpc.get_tx_receipt = AsyncMock(return_value={"status": 1})
+    wallet = InfernetWallet(ADDRESS, rpc)  # type: ignore
+    functions = rpc.get_contract.return_value.functions
+    functions.approve.return_value.transact = AsyncMock(return_value=HexBytes("0x01"))
+
+    assert await wallet.approve(ADDRESS, ADDRESS, 100) == {"status": 1}  # type: ignore
+    functions.allowance.assert_not_called()
+
+    rpc.get_tx_receipt.return_value = {"status": 0}
+    with pytest.raises(AssertionError):
+        await wallet.approve(ADDRESS, ADDRESS, 100)  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_create_wallet_checks_receipt_status() -> None:
+    """Test that wallet creation is verified from the receipt, without reading back."""
+
+    rpc = MagicMock()
+    rpc.call = AsyncMock()
+    rpc.get_tx_receipt = AsyncMock(return_value={"status": 1})
+    factory = WalletFactory(ADDRESS, rpc)  # type: ignore
+    create_wallet = rpc.get_contract.return_value.functions.createWallet
+    create_wallet.return_value.call = AsyncMock(return_value=ADDRESS)
+    create_wallet.return_value.transact = AsyncMock(return_value=HexBytes("0x01"))
+
+    wallet = await factory.create_wallet(ADDRESS)  # type: ignore
+    assert wallet.address == ADDRESS
+    rpc.call.assert_not_called()
+
+    rpc.get_tx_receipt.return_value = {"status": 0}
+    with pytest.raises(AssertionError):
+        await factory.create_wallet(ADDRESS)  # type: ignore
+
+
+@pytest.mark.asyncio
+@patch.object(WebsocketProviderV2, "disconnect")
+@patch.object(WebsocketProviderV2, "connect")
+async def test_from_websocket(
+    mock_connect: AsyncMock, mock_disconnect: AsyncMock
+) -> None:
+    """Test that websocket RPC clients connect once and share one client."""
+
+    rpc = await RPC.from_websocket("ws://localhost:8545")
+
+    mock_connect.assert_awaited_once()
+    assert isinstance(rpc._web3.provider, WebsocketProviderV2)
+    assert rpc._reader is rpc._web3
+
+    await rpc.disconnect()
+    mock_disconnect.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_disconnect_closes_http_session() -> None:
+    """Test that exiting an RPC client closes its endpoint's pooled HTTP session."""
+
+    url = "http://localhost:8547"
+    async with RPC(url):
+        session = await async_cache_and_return_session(URI(url))
+        assert not session.closed
+
+    assert session.closed
+
+
+@pytest.mark.asyncio
+async def test_disconnect_keeps_shared_http_session() -> None:
+    """Test that an endpoint's HTTP session stays open until its last RPC client
+    disconnects."""
+
+    url = "http://localhost:8548"
+    first, second = RPC(url), RPC(url)
+    assert first._web3.provider is second._web3.provider
+    session = await async_cache_and_return_session(URI(url))
+
+    await first.disconnect()
+    await first.disconnect()
+    assert not session.closed
+    assert await async_cache_and_return_session(URI(url)) is session
+
+    await second.disconnect()
+    assert session.closed
+
+
+@pytest.mark.asyncio
+async def test_are_valid_wallets() -> None:
+    """Test that wallet validity is read for many wallets with one Multicall3 call."""
+
+    rpc = MagicMock()
+    factory = WalletFactory(ADDRESS, rpc)  # type: ignore
+    aggregate = rpc.get_contract.return_value.functions.aggregate
+    aggregate.return_value.call = AsyncMock(
+        return_value=(1, [(1).to_bytes(32, "big"), (0).to_bytes(32, "big")])
+    )
+
+    wallets = ["0x" + "22" * 20, "0x" + "33" * 20]
+    assert await factory.are_valid_wallets(wallets) == {  # type: ignore
+        wallets[0]: True,
+        wallets[1]: False,
+    }
+    selector = WALLET_FACTORY_SELECTORS["isValidWallet"]
+    aggregate.assert_called_once_with(
+        [(ADDRESS, selector + encode(["address"], [wallet])) for wallet in wallets]
+    )
+
+    aggregate.return_value.call.return_value = (1, [b"", b""])
+    with pytest.raises(BadFunctionCallOutput):
+        await factory.are_valid_wallets(wallets)  # type: ignore
+
+
+def test_keccak256() -> None:
+    """Test that the selected keccak backend computes Keccak-256, not NIST SHA3-256."""
+
+    assert (
+        keccak256(b"").hex()
+        == "c5d2460186f7233c927e7db2dcc703c0e500b653ca82273b7bfad8045d85a470"
+    )
+    assert keccak256(b"hello") == Web3.keccak(b"hello")
+
+
+@pytest.mark.parametrize(
+    "value", ["", "a", "a,b", "x" * 32, "x" * 33, "hello-world,é-container"]
+)
+def test_encode_string(value: str) -> None:
+    """Test that inline string encoding matches eth-abi."""
+
+    assert _encode_string(value) == encode(["string"], [value])
+
+
+def test_containers_hash_cached() -> None:
+    """Test that subscriptions for the same containers share one hash computation."""
+
+    _containers_hash.cache_clear()
+    for _ in range(2):
+        Subscription(
+            ADDRESS, 1, 2, 3, 1, ["a", "b"], False, ADDRESS, 5, ADDRESS, ADDRESS
+        )
+
+    assert _containers_hash.cache_info().hits == 1
+
+
+@pytest.mark.asyncio
+async def test_get_chain_id_cached() -> None:
+    """Test that the chain ID is only requested once per RPC client."""
+
+    rpc = RPC("http://localhost:8545")
+    with patch.object(
+        type(rpc._reader.eth), "chain_id", new_callable=PropertyMock
+    ) as mock_chain_id:
+        mock_chain_id.side_effect = AsyncMock(return_value=1)
+
+        assert await rpc.get_chain_id() == 1
+        assert await rpc.get_chain_id() == 1
+
+    mock_chain_id.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_get_transaction_params() -> None:
+    """Test that transaction params are collected as web3py's middleware would."""
+
+    rpc = await RPC("http://localhost:8545").initialize_with_private_key(
+        "0x" + "ab" * 32
+    )
+    rpc._chain_id = 31337
+    eth = type(rpc._reader.eth)
+    with patch.object(
+        eth, "get_transaction_count", new=AsyncMock(return_value=7)
+    ) as mock_nonce, patch.object(
+        eth, "get_block", new=AsyncMock(return_value={"baseFeePerGas": 100})
+    ), patch.object(
+        eth, "max_priority_fee", new_callable=PropertyMock
+    ) as mock_priority_fee:
+        mock_priority_fee.side_effect = AsyncMock(return_value=2)
+
+        assert await rpc.get_transaction_params() == {
+            "from": rpc.account.address,
+            "nonce": 7,
+            "maxFeePerGas": 202,
+            "maxPriorityFeePerGas": 2,
+            "chainId": 31337,
+        }
+
+    mock_nonce.assert_awaited_once_with(rpc.account.address, "pending")
+
+
+@pytest.mark.parametrize(
+    "nonce, expiry, chain_id, lazy",
+    [
+        (0, 0, 1, False),
+        (7, 2**32 - 1, 31337, True),
+        (2**32 - 1, 1700000000, 8453, False),
+    ],
+)
+def test_delegate_subscription_matches_encode_typed_data(
+    nonce: int, expiry: int, chain_id: int, lazy: bool
+) -> None:
+    """Test that precomputed struct hashes match eth-account's EIP-712 encoding."""
+
+    owner, verifier = "0x" + "22" * 20, "0x" + "33" * 20
+    sub = Subscription(
+        owner, 10, 20, 3, 2, ["a"], lazy, verifier, 10**20, ADDRESS, ADDRESS
+    )
+    expected = encode_typed_data(
+        full_message={
+            "types": {
+                "EIP712Domain": [
+                    {"name": "name", "type": "string"},
+                    {"name": "version", "type": "string"},
+                    {"name": "chainId", "type": "uint256"},
+                    {"name": "verifyingContract", "type": "address"},
+                ],
+                "DelegateSubscription": [
+                    {"name": "nonce", "type": "uint32"},
+                    {"name": "expiry", "type": "uint32"},
+                    {"name": "sub", "type": "Subscription"},
+                ],
+                "Subscription": [
+                    {"name": "owner", "type": "address"},
+                    {"name": "activeAt", "type": "uint32"},
+                    {"name": "period", "type": "uint32"},
+                    {"name": "frequency", "type": "uint32"},
+                    {"name": "redundancy", "type": "uint16"},
+                    {"name": "containerId", "type": "bytes32"},
+                    {"name": "lazy", "type": "bool"},
+                    {"name": "verifier", "type": "address"},
+                    {"name": "paymentAmount", "type": "uint256"},
+                    {"name": "paymentToken", "type": "address"},
+                    {"name": "wallet", "type": "address"},
+                ],
+            },
+            "primaryType": "DelegateSubscription",
+            "domain": {
+                "name": "InfernetCoordinator",
+                "version": "1",
+                "chainId": chain_id,
+                "verifyingContract": ADDRESS,
+            },
+            "message": {
+                "nonce": nonce,
+                "expiry": expiry,
+                "sub": {
+                    "owner": owner,
+                    "activeAt": 10,
+                    "period": 20,
+                    "frequency": 3,
+                    "redundancy": 2,
+                    "containerId": HexBytes(sub.serialized["containers"]),
+                    "lazy": lazy,
+                    "verifier": verifier,
+                    "paymentAmount": 10**20,
+                    "paymentToken": ADDRESS,
+                    "wallet": ADDRESS,
+                },
+            },
+        }
+    )
+
+    assert (
+        sub.get_delegate_subscription_typed_data(
+            nonce, expiry, chain_id, ADDRESS  # type: ignore
+        )
+        == expected
+    )
+
+
+def test_checksum_matches_web3_exhaustive() -> None:
+    """Test branch-free checksumming against web3py over many derived addresses."""
+
+    for i in range(256):
+        address = "0x" + keccak256(i.to_bytes(2, "big")).hex()[:40]
+        assert _checksum.__wrapped__(address) == Web3.to_checksum_address(address)
@@ -0,0 +1,155 @@
+import io
+import json
+from typing import Any, AsyncGenerator, Union
+from unittest.mock import AsyncMock, create_autospec, patch
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from infernet_client.cli import _ACTIONS, _approve, _fund, cli
+from infernet_client.cli.options import AmountWeiType, output_result
+
+WALLET = "0x7749f632935738EA2Dd32EBEcbb8B9145E1efeF6"
+SPENDER = "0x3C44CdDdB6a900fa2b585dd299e03d12FA4293BC"
+
+
+def test_output_result_json() -> None:
+    """Test that results are output as indented JSON."""
+
+    output = io.StringIO()
+    output_result({"id": "1", "result": [1, 2]}, output)
+
+    assert (
+        output.getvalue() == json.dumps({"id": "1", "result": [1, 2]}, indent=2) + "\n"
+    )
+
+
+def test_output_result_big_int() -> None:
+    """Test that integers wider than 64 bits are still output exactly."""
+
+    output = io.StringIO()
+    output_result({"amount": 10**20}, output)
+
+    assert json.loads(output.getvalue()) == {"amount": 10**20}
+
+
+@pytest.mark.parametrize("amount", [1, 10**20])
+def test_output_result_buffered(amount: int) -> None:
+    """Test that results are written through the binary buffer of text streams, as
+    UTF-8, whether they're serialized by orjson or the stdlib fallback."""
+
+    buffer = io.BytesIO()
+    output = io.TextIOWrapper(buffer, encoding="utf-8")
+    output_result({"name": "r\xf6bert", "amount": amount}, output)
+    output.flush()
+
+    assert buffer.getvalue() == (
+        f'{{\n  "name": "r\xf6bert",\n  "amount": {amount}\n}}\n'.encode()
+    )
+
+
+async def _stream(*_: Any) -> AsyncGenerator[Union[str, bytes], None]:
+    yield "job-id"
+    for chunk in (b"hello ", "w\xf6rld", b" \xf0\x9f\x9a\x80"):
+        yield chunk
+
+
+@patch("infernet_client.node.NodeClient.request_stream", _stream)
+def test_request_stream_output() -> None:
+    """Test that streamed chunks are written out in order after the job ID."""
+
+    result = CliRunner().invoke(
+        cli, ["stream", "--url", "http://node", "-c", "echo", "-i", "-"], input="{}"
+    )
+
+    assert result.exit_code == 0, result.output
+    assert result.output == "Job ID: job-id\nhello w\xf6rld \U0001f680\n"
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("100", 100),
+        ("1e3", 1000),
+        ("1 ether", 10**18),
+        ("1.5 gwei", 1_500_000_000),
+        ("100000 ether", 10**23),
+    ],
+)
+def test_amount_wei_type(value: str, expected: int) -> None:
+    """Test that amounts are parsed into wei."""
+
+    assert AmountWeiType().convert(value, None, None) == expected
+
+
+@pytest.mark.parametrize("value", ["one", "1 foo", "-5", str(2**256), -5, 2**256])
+def test_amount_wei_type_invalid(value: Union[str, int]) -> None:
+    """Test that invalid amounts are reported as usage errors."""
+
+    with pytest.raises(click.BadParameter):
+        AmountWeiType().convert(value, None, None)
+
+
+@patch("infernet_client.chain.rpc.RPC.initialize_with_private_key", new=AsyncMock())
+def test_do_runs_steps_in_order() -> None:
+    """Test that the do command runs each step in order over one RPC client."""
+
+    fund = create_autospec(_fund, return_value="funded")
+    approve = create_autospec(_approve, return_value="approved")
+    steps = [
+        {"action": "fund", "wallet": WALLET.lower(), "amount": "1 gwei"},
+        {"action": "approve", "wallet": WALLET, "spender": SPENDER, "amount": 5},
+    ]
+    with patch.dict(_ACTIONS, {"fund": fund, "approve": approve}):
+        result = CliRunner().invoke(
+            cli,
+            ["do", "--rpc-url", "http://rpc", "-pk", "0x1", "-i", "-"],
+            input=json.dumps(steps),
+        )
+
+    assert result.exit_code == 0, result.output
+    assert result.output == "funded\napproved\n"
+    rpc = fund.call_args.args[0]
+    fund.assert_awaited_once_with(rpc, wallet=WALLET, amount=10**9)
+    approve.assert_awaited_once_with(rpc, wallet=WALLET, spender=SPENDER, amount=5)
+
+
+@pytest.mark.parametrize(
+    "steps, error",
+    [
+        ({"action": "fund"}, "Expected a JSON list of steps."),
+        ([{"wallet": "0x1"}], "Step 0: expected an action"),
+        ([{"action": "burn"}], "Step 0: expected an action"),
+        ([{"action": "fund", "amount": "1 foo"}], "Step 0: '1 foo' is not a valid"),
+        ([{"action": "fund", "amount": 1}], "Step 0: missing a required argument"),
+        ([{"action": "fund", "amount": 1.5}], "Step 0: 1.5 is not a valid amount"),
+        ([{"action": "fund", "amount": None}], "Step 0: None is not a valid amount"),
+        ([{"action": "fund", "amount": True}], "Step 0: True is not a valid amount"),
+        (
+            [
+                {"action": "fund", "wallet": WALLET, "amount": 1},
+                {"action": "fund", "wallet": "0x1", "amount": 1},
+            ],
+            "Step 1: '0x1' is not a valid address",
+        ),
+        (
+            [{"action": "fund", "wallet": WALLET, "amount": 1, "token": 1}],
+            "Step 0: 1 is not a valid address",
+        ),
+    ],
+)
+def test_do_invalid_steps(steps: Any, error: str) -> None:
+    """Test that steps are validated before any of them are run."""
+
+    fund = create_autospec(_fund)
+    with patch.dict(_ACTIONS, {"fund": fund}):
+        result = CliRunner().invoke(
+            cli,
+            ["do", "--rpc-url", "http://rpc", "-pk", "0x1", "-i", "-"],
+            input=json.dumps(steps),
+        )
+
+    assert result.exit_code == 2
+    assert error in result.output
+    fund.assert_not_called()
@@ -1,15 +1,21 @@
-from typing import Any, cast
+import json
+from types import SimpleNamespace
+from typing import Any, AsyncGenerator, cast
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 from uuid import uuid4
 
 import aiohttp
 import pytest
+import pytest_asyncio
 from eth_typing import ChecksumAddress, HexAddress, HexStr
 
 from infernet_client import NodeClient, RouterClient
 from infernet_client.error import APIError
+from infernet_client.node import _json_dumps
 from infernet_client.types import ErrorResponse, JobResponse
 from tests.helpers import (
+    bind_response,
+    create_json_response,
     create_mock_response,
     get_job_results_side_effect,
     get_subscription_params,
@@ -20,19 +26,42 @@ from tests.shared import (
     job_request_nonexistent,
     job_request_result,
     job_request_streamed,
+    mock_containers,
+    mock_info,
+    mock_nodes,
 )
 
 
-@pytest.fixture
-def node() -> NodeClient:
+@pytest.fixture(autouse=True)
+def http_mocks(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Replaces the HTTP methods of every client session, so that no test reaches the
+    network. Tests configure the mocked responses."""
+    mocks = SimpleNamespace(get=MagicMock(), post=MagicMock(), put=MagicMock())
+    for verb, mock in vars(mocks).items():
+        monkeypatch.setattr(f"aiohttp.ClientSession.{verb}", mock)
+    return mocks
+
+
+@pytest.fixture(autouse=True)
+def mock_sleep(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+    """Skips the waits between polls for job results."""
+    mock = AsyncMock()
+    monkeypatch.setattr("infernet_client.node.sleep", mock)
+    return mock
+
+
+@pytest_asyncio.fixture
+async def node() -> AsyncGenerator[NodeClient, None]:
     """Common node client fixture for all tests."""
-    return NodeClient("http://127.0.0.1:4000")
+    async with NodeClient("http://127.0.0.1:4000") as client:
+        yield client
 
 
-@pytest.fixture
-def router() -> RouterClient:
+@pytest_asyncio.fixture
+async def router() -> AsyncGenerator[RouterClient, None]:
     """Common router client fixture for all tests."""
-    return RouterClient("http://127.0.0.1:4000")
+    async with RouterClient("http://127.0.0.1:4000") as client:
+        yield client
 
 
 @pytest.fixture
@@ -54,145 +83,168 @@ def error_response(request: Any) -> MagicMock:
 @pytest.fixture
 def error_unexpected() -> Mock:
     """Fixture for creating an unexpected error"""
-    mock_response = Mock()
-    mock_response.json = AsyncMock()
-    mock_response.status = 500
+    mock_response = create_json_response(status=500)
     mock_response.raise_for_status.side_effect = aiohttp.ServerConnectionError()
     return mock_response
 
 
 @pytest.mark.asyncio
-@pytest.mark.usefixtures("node")
-async def test_health(node: NodeClient) -> None:
+async def test_health(node: NodeClient, http_mocks: SimpleNamespace) -> None:
     """Test that health returns True when the server is healthy."""
 
-    with patch("aiohttp.ClientSession.get") as mock_get:
-        mock_response = Mock()
-        mock_response.json = AsyncMock(return_value={"status": "healthy"})
-        mock_get.return_value.__aenter__.return_value = mock_response
+    mock_get = http_mocks.get
+    mock_response = create_json_response({"status": "healthy"})
+    bind_response(mock_get, mock_response)
 
-        assert await node.health() is True
-        assert mock_get.call_args[0][0] == f"{node.base_url}/health"
+    assert await node.health() is True
+    assert mock_get.call_args[0][0] == f"{node.base_url}/health"
 
 
 @pytest.mark.asyncio
-@pytest.mark.usefixtures("node")
-async def test_health_fail(node: NodeClient) -> None:
+async def test_health_fail(node: NodeClient, http_mocks: SimpleNamespace) -> None:
     """Test that health returns False when the server is unhealthy."""
 
-    with patch("aiohttp.ClientSession.get") as mock_get:
-        mock_response = Mock()
-        mock_response.json = AsyncMock(return_value={"status": "unhealthy"})
-        mock_get.return_value.__aenter__.return_value = mock_response
+    mock_get = http_mocks.get
+    mock_response = create_json_response({"status": "unhealthy"})
+    bind_response(mock_get, mock_response)
+
+    assert await node.health() is False
+    assert mock_get.call_args[0][0] == f"{node.base_url}/health"
+
 
-        assert await node.health() is False
-        assert mock_get.call_args[0][0] == f"{node.base_url}/health"
+@pytest.mark.parametrize("body", [{"amount": 10**18}, {"amount": 10**20}])
+def test_json_dumps(body: dict[str, Any]) -> None:
+    """Test that request bodies are serialized exactly, including integers too wide
+    for orjson."""
+
+    assert json.loads(_json_dumps(body)) == body
 
 
 @pytest.mark.asyncio
-@pytest.mark.usefixtures("node")
-@pytest.mark.parametrize(
-    "error_response",
-    [(500, "Internal Server Error"), (400, "Some other error")],
-    indirect=True,
-)
-async def test_health_exception(node: NodeClient, error_response: MagicMock) -> None:
-    """Test that health raises an exception when the server returns an error."""
+async def test_session_reused_until_closed(http_mocks: SimpleNamespace) -> None:
+    """Test that a client reuses one session across requests until it is closed."""
 
-    with patch("aiohttp.ClientSession.get") as mock_get:
-        mock_get.return_value.__aenter__.return_value = error_response
-        with pytest.raises(aiohttp.ClientResponseError) as exc_info:
-            await node.health()
+    mock_get = http_mocks.get
+    mock_response = create_json_response({"status": "healthy"})
+    bind_response(mock_get, mock_response)
 
-        assert exc_info.value.status == error_response.status
-        assert (
-            exc_info.value.message
-            == error_response.raise_for_status.side_effect.message
-        )
-        assert mock_get.call_args[0][0] == f"{node.base_url}/health"
+    async with NodeClient("http://127.0.0.1:4000") as node:
+        await node.health()
+        session = node._session
+        await node.health()
+        assert session is not None and node._session is session
+
+    assert session.closed
+    assert node._session is None
 
 
 @pytest.mark.asyncio
-@pytest.mark.usefixtures("node")
-async def test_info(node: NodeClient) -> None:
-    """Test that get_info returns the server information."""
+async def test_session_per_request_outside_context(http_mocks: SimpleNamespace) -> None:
+    """Test that a client used without `async with` closes the session it opens for
+    each request."""
 
-    mock_info = {
-        "version": "0.3.0",
-        "chain": {
-            "enabled": False,
-            "address": "",
-        },
-        "containers": [
-            {
-                "id": "infernet-client-test",
-                "external": True,
-                "image": "ritualnetwork/infernet-client-tester:0.3.0",
-                "description": "",
-            }
-        ],
-        "pending": {
-            "offchain": 0,
-            "onchain": 0,
-        },
-    }
+    bind_response(http_mocks.get, create_json_response({"status": "healthy"}))
 
-    with patch("aiohttp.ClientSession.get") as mock_get:
-        mock_response = Mock()
-        mock_response.json = AsyncMock(return_value=mock_info)
-        mock_get.return_value.__aenter__.return_value = mock_response
+    sessions: list[aiohttp.ClientSession] = []
+
+    def _session(**kwargs: Any) -> aiohttp.ClientSession:
+        sessions.append(aiohttp.ClientSession(**kwargs))
+        return sessions[-1]
+
+    node = NodeClient("http://127.0.0.1:4000")
+    with patch("infernet_client.node.ClientSession", side_effect=_session):
+        assert await node.health() is True
+        assert await node.health() is True
 
-        assert await node.get_info() == mock_info
-        assert mock_get.call_args[0][0] == f"{node.base_url}/info"
+    assert len(sessions) == 2
+    assert all(session.closed for session in sessions)
+    assert node._session is None
 
 
 @pytest.mark.asyncio
-@pytest.mark.usefixtures("node")
+@pytest.mark.parametrize(
+    "method, path",
+    [("health", "health"), ("get_info", "info"), ("get_resources", "resources")],
+)
 @pytest.mark.parametrize(
     "error_response",
     [(500, "Internal Server Error"), (400, "Some other error")],
     indirect=True,
 )
-async def test_info_fail(node: NodeClient, error_response: MagicMock) -> None:
-    """Test that get_info raises an exception when the server returns an error."""
+async def test_get_exception(
+    node: NodeClient,
+    error_response: MagicMock,
+    http_mocks: SimpleNamespace,
+    method: str,
+    path: str,
+) -> None:
+    """Test that node info requests raise an exception when the server returns an
+    error."""
 
-    with patch("aiohttp.ClientSession.get") as mock_get:
-        mock_get.return_value.__aenter__.return_value = error_response
-        with pytest.raises(aiohttp.ClientResponseError) as exc_info:
-            await node.get_info()
+    mock_get = http_mocks.get
+    bind_response(mock_get, error_response)
+    with pytest.raises(aiohttp.ClientResponseError) as exc_info:
+        await getattr(node, method)()
 
-        assert exc_info.value.status == error_response.status
-        assert (
-            exc_info.value.message
-            == error_response.raise_for_status.side_effect.message
-        )
-        assert mock_get.call_args[0][0] == f"{node.base_url}/info"
+    assert exc_info.value.status == error_response.status
+    assert exc_info.value.message == error_response.raise_for_status.side_effect.message
+    assert mock_get.call_args[0][0] == f"{node.base_url}/{path}"
+
+
+@pytest.mark.asyncio
+async def test_info(node: NodeClient, http_mocks: SimpleNamespace) -> None:
+    """Test that get_info returns the server information."""
+
+    mock_get = http_mocks.get
+    mock_response = create_json_response(mock_info)
+    bind_response(mock_get, mock_response)
+
+    assert await node.get_info() == mock_info
+    assert mock_get.call_args[0][0] == f"{node.base_url}/info"
 
 
 @pytest.mark.asyncio
-@pytest.mark.usefixtures("node")
-async def test_request_job(node: NodeClient) -> None:
+@pytest.mark.parametrize("cache_ttl, requests", [(0, 3), (60, 2)])
+async def test_info_cache(
+    cache_ttl: float, requests: int, http_mocks: SimpleNamespace
+) -> None:
+    """Test that get_info reuses responses for cache_ttl seconds, until the cache is
+    cleared."""
+
+    mock_get = http_mocks.get
+    mock_response = create_json_response({"version": "0.3.0"})
+    bind_response(mock_get, mock_response)
+
+    async with NodeClient("http://127.0.0.1:4000", cache_ttl) as node:
+        await node.get_info()
+        await node.get_info()
+        node.clear_cache()
+        assert (await node.get_info())["version"] == "0.3.0"
+
+    assert mock_get.call_count == requests
+
+
+@pytest.mark.asyncio
+async def test_request_job(node: NodeClient, http_mocks: SimpleNamespace) -> None:
     """Test that request_job returns a job ID."""
 
     job_id = uuid4()
-    with patch("aiohttp.ClientSession.post") as mock_post:
-        mock_response = Mock()
-        mock_response.json = AsyncMock(return_value={"id": str(job_id)})
-        mock_post.return_value.__aenter__.return_value = mock_response
+    mock_post = http_mocks.post
+    mock_response = create_json_response({"id": str(job_id)})
+    bind_response(mock_post, mock_response)
 
-        assert await node.request_job(job_request) == str(job_id)
-        assert mock_post.call_args[0][0] == f"{node.base_url}/api/jobs"
+    assert await node.request_job(job_request) == str(job_id)
+    assert mock_post.call_args[0][0] == f"{node.base_url}/api/jobs"
 
 
 @pytest.mark.asyncio
-@pytest.mark.usefixtures("node")
 @pytest.mark.parametrize(
     "error_response",
     [(405, "")],
     indirect=True,
 )
 async def test_request_job_nonexistent_container(
-    node: NodeClient, error_response: MagicMock
+    node: NodeClient, error_response: MagicMock, http_mocks: SimpleNamespace
 ) -> None:
     """Test that request_job raises an exception when the container is not supported."""
 
@@ -200,117 +252,108 @@ async def test_request_job_nonexistent_container(
     error_message = "Container not supported"
     error_params = {"container": "non-existent"}
 
-    with patch("aiohttp.ClientSession.post") as mock_post:
-        error_response.json = AsyncMock(
-            return_value={"error": error_message, "params": error_params}
-        )
-        mock_post.return_value.__aenter__.return_value = error_response
+    mock_post = http_mocks.post
+    error_response.json = AsyncMock(
+        return_value={"error": error_message, "params": error_params}
+    )
+    bind_response(mock_post, error_response)
 
-        with pytest.raises(APIError) as exc_info:
-            await node.request_job(job_request_nonexistent)
+    with pytest.raises(APIError) as exc_info:
+        await node.request_job(job_request_nonexistent)
 
-        assert exc_info.value.status_code == 405
-        assert exc_info.value.message == error_message
-        assert exc_info.value.params == error_params
-        assert mock_post.call_args[0][0] == f"{node.base_url}/api/jobs"
+    assert exc_info.value.status_code == 405
+    assert exc_info.value.message == error_message
+    assert exc_info.value.params == error_params
+    assert mock_post.call_args[0][0] == f"{node.base_url}/api/jobs"
 
 
 @pytest.mark.asyncio
-@pytest.mark.usefixtures("node")
 @pytest.mark.parametrize(
     "error_response",
     [(500, "")],
     indirect=True,
 )
 async def test_request_job_malformed_body(
-    node: NodeClient, error_response: MagicMock
+    node: NodeClient, error_response: MagicMock, http_mocks: SimpleNamespace
 ) -> None:
     """Test that request_job raises an exception when the request body is malformed."""
 
     # Error message returned by the server
     error_message = 'Could not enqueue job: missing value for field "data"'
 
-    with patch("aiohttp.ClientSession.post") as mock_post:
-        error_response.json = AsyncMock(return_value={"error": error_message})
-        mock_post.return_value.__aenter__.return_value = error_response
+    mock_post = http_mocks.post
+    error_response.json = AsyncMock(return_value={"error": error_message})
+    bind_response(mock_post, error_response)
 
-        with pytest.raises(APIError) as exc_info:
-            await node.request_job(job_request_malformed)  # type: ignore
+    with pytest.raises(APIError) as exc_info:
+        await node.request_job(job_request_malformed)  # type: ignore
 
-        assert exc_info.value.status_code == 500
-        assert exc_info.value.message == error_message
-        assert mock_post.call_args[0][0] == f"{node.base_url}/api/jobs"
+    assert exc_info.value.status_code == 500
+    assert exc_info.value.message == error_message
+    assert mock_post.call_args[0][0] == f"{node.base_url}/api/jobs"
 
 
 @pytest.mark.asyncio
-@pytest.mark.usefixtures("node")
-@pytest.mark.usefixtures("error_unexpected")
 async def test_request_job_unexpected_error(
-    node: NodeClient, error_unexpected: MagicMock
+    node: NodeClient, error_unexpected: MagicMock, http_mocks: SimpleNamespace
 ) -> None:
     """Test that request_job raises an exception when an unexpected error occurs."""
 
-    with patch("aiohttp.ClientSession.post") as mock_post:
-        mock_post.return_value.__aenter__.return_value = error_unexpected
+    mock_post = http_mocks.post
+    bind_response(mock_post, error_unexpected)
 
-        # Ensure unexpected errors raise an exception
-        with pytest.raises(aiohttp.ServerConnectionError):
-            await node.request_job(job_request)
-        assert mock_post.call_args[0][0] == f"{node.base_url}/api/jobs"
+    # Ensure unexpected errors raise an exception
+    with pytest.raises(aiohttp.ServerConnectionError):
+        await node.request_job(job_request)
+    assert mock_post.call_args[0][0] == f"{node.base_url}/api/jobs"
 
 
 @pytest.mark.asyncio
-@pytest.mark.usefixtures("node")
-async def test_request_many_jobs(node: NodeClient) -> None:
+async def test_request_many_jobs(node: NodeClient, http_mocks: SimpleNamespace) -> None:
     """Test that batch job request returns job IDs."""
 
     job_ids = [uuid4(), uuid4()]
-    with patch("aiohttp.ClientSession.post") as mock_post:
-        mock_response = Mock()
-        mock_response.json = AsyncMock(
-            return_value=[{"id": str(job_id)} for job_id in job_ids]
-        )
-        mock_post.return_value.__aenter__.return_value = mock_response
-
-        results = await node.request_jobs(
-            [
-                job_request,
-                job_request,
-            ]
-        )
+    mock_post = http_mocks.post
+    mock_response = create_json_response([{"id": str(job_id)} for job_id in job_ids])
+    bind_response(mock_post, mock_response)
+
+    results = await node.request_jobs(
+        [
+            job_request,
+            job_request,
+        ]
+    )
 
-        assert len(results) == 2
-        assert all(
-            isinstance(cast(JobResponse, result)["id"], str) for result in results
-        )
-        assert mock_post.call_args[0][0] == f"{node.base_url}/api/jobs/batch"
+    assert len(results) == 2
+    assert all(isinstance(cast(JobResponse, result)["id"], str) for result in results)
+    assert mock_post.call_args[0][0] == f"{node.base_url}/api/jobs/batch"
 
 
 @pytest.mark.asyncio
-@pytest.mark.usefixtures("node")
-async def test_request_many_jobs_nonexistent_container(node: NodeClient) -> None:
+async def test_request_many_jobs_nonexistent_container(
+    node: NodeClient, http_mocks: SimpleNamespace
+) -> None:
     """Test that batch job request returns an error when container is not supported."""
 
     job_id = uuid4()
-    with patch("aiohttp.ClientSession.post") as mock_post:
-        mock_response = Mock()
-        mock_response.json = AsyncMock(
-            return_value=[
-                {"id": str(job_id)},
-                {
-                    "error": "Container not supported",
-                    "params": {"container": "non-existent"},
-                },
-            ]
-        )
-        mock_post.return_value.__aenter__.return_value = mock_response
+    mock_post = http_mocks.post
+    mock_response = create_json_response(
+        [
+            {"id": str(job_id)},
+            {
+                "error": "Container not supported",
+                "params": {"container": "non-existent"},
+            },
+        ]
+    )
+    bind_response(mock_post, mock_response)
 
-        results = await node.request_jobs(
-            [
-                job_request,
-                job_request_nonexistent,
-            ]
-        )
+    results = await node.request_jobs(
+        [
+            job_request,
+            job_request_nonexistent,
+        ]
+    )
 
     assert len(results) == 2
     assert mock_post.call_args[0][0] == f"{node.base_url}/api/jobs/batch"
@@ -325,44 +368,41 @@ async def test_request_many_jobs_nonexistent_container(node: NodeClient) -> None
 
 
 @pytest.mark.asyncio
-@pytest.mark.usefixtures("node")
 @pytest.mark.parametrize(
     "error_response",
     [(500, "")],
     indirect=True,
 )
 async def test_request_many_jobs_malformed_body(
-    node: NodeClient, error_response: MagicMock
+    node: NodeClient, error_response: MagicMock, http_mocks: SimpleNamespace
 ) -> None:
     """Test that batch job request raises an exception when body is malformed."""
 
     # Error message returned by the server
     error_message = 'Could not enqueue job: missing value for field "data"'
 
-    with patch("aiohttp.ClientSession.post") as mock_post:
-        error_response.json = AsyncMock(return_value={"error": error_message})
-        mock_post.return_value.__aenter__.return_value = error_response
+    mock_post = http_mocks.post
+    error_response.json = AsyncMock(return_value={"error": error_message})
+    bind_response(mock_post, error_response)
 
-        with pytest.raises(APIError) as exc_info:
-            await node.request_jobs(
-                [
-                    job_request,
-                    job_request_malformed,  # type: ignore
-                ]
-            )
+    with pytest.raises(APIError) as exc_info:
+        await node.request_jobs(
+            [
+                job_request,
+                job_request_malformed,  # type: ignore
+            ]
+        )
 
-        assert exc_info.value.status_code == 500
-        assert exc_info.value.message == error_message
-        assert mock_post.call_args[0][0] == f"{node.base_url}/api/jobs/batch"
+    assert exc_info.value.status_code == 500
+    assert exc_info.value.message == error_message
+    assert mock_post.call_args[0][0] == f"{node.base_url}/api/jobs/batch"
 
 
 @pytest.mark.asyncio
-@pytest.mark.usefixtures("node")
 async def test_get_job_result_sync(node: NodeClient) -> None:
     """Test that get_job_result_sync returns job result after enough retries."""
 
-    # Patch sleep to avoid waiting for retries
-    with patch("infernet_client.node.sleep", new=AsyncMock()), patch.object(
+    with patch.object(
         node,
         "get_job_results",
         new=AsyncMock(side_effect=get_job_results_side_effect(5)),
@@ -375,7 +415,6 @@ async def test_get_job_result_sync(node: NodeClient) -> None:
 
 
 @pytest.mark.asyncio
-@pytest.mark.usefixtures("node")
 async def test_get_job_result_sync_wrong_id(node: NodeClient) -> None:
     """Test that get_job_result_sync returns None for a wrong job ID."""
 
@@ -386,116 +425,216 @@ async def test_get_job_result_sync_wrong_id(node: NodeClient) -> None:
 
 
 @pytest.mark.asyncio
-@pytest.mark.usefixtures("node")
-async def test_get_job_result_sync_timeout(node: NodeClient) -> None:
+async def test_get_job_result_sync_timeout(
+    node: NodeClient, mock_sleep: AsyncMock
+) -> None:
     """Test that get_job_result_sync raises a TimeoutError after enough retries."""
 
-    # Patch sleep to avoid waiting for retries
-    with patch("infernet_client.node.sleep", new=AsyncMock()), patch.object(
+    with patch("infernet_client.node.uniform", return_value=1), patch.object(
         node,
         "get_job_results",
-        new=AsyncMock(side_effect=get_job_results_side_effect(6)),
+        new=AsyncMock(side_effect=get_job_results_side_effect(100)),
     ) as mock_get_job_results:
         with pytest.raises(TimeoutError) as exc_info:
             await node.get_job_result_sync("some-job", retries=5)
 
         assert exc_info.value.args[0] == "Job result not available after 5 retries"
-        assert mock_get_job_results.await_count == 5
+        # Polls back off from 50ms up to 1s, waiting 5 seconds in total
+        delays = [args[0] for args, _ in mock_sleep.await_args_list]
+        assert delays[:6] == [0.05, 0.1, 0.2, 0.4, 0.8, 1.0]
+        assert sum(delays) == pytest.approx(5)
+        assert mock_get_job_results.await_count == len(delays) + 1
 
 
 @pytest.mark.asyncio
-@pytest.mark.usefixtures("node")
-async def test_get_job_results(node: NodeClient) -> None:
-    """Test that get_job_results returns job results."""
+async def test_get_job_result_sync_poll_interval(
+    node: NodeClient, mock_sleep: AsyncMock
+) -> None:
+    """Test that get_job_result_sync backs off within the given poll intervals."""
 
-    job_ids = [str(uuid4()) for _ in range(3)]
-    with patch("aiohttp.ClientSession.get") as mock_get:
-        mock_response = Mock()
-        mock_response.json = AsyncMock(
-            return_value=[{"id": job_id, **job_request_result} for job_id in job_ids]
-        )
-        mock_get.return_value.__aenter__.return_value = mock_response
+    with patch("infernet_client.node.uniform", return_value=1), patch.object(
+        node,
+        "get_job_results",
+        new=AsyncMock(side_effect=get_job_results_side_effect(100)),
+    ):
+        with pytest.raises(TimeoutError):
+            await node.get_job_result_sync(
+                "some-job", retries=2, poll_interval=0.5, max_poll_interval=0.75
+            )
+
+        delays = [args[0] for args, _ in mock_sleep.await_args_list]
+        assert delays == [0.5, 0.75, 0.75]
+
+
+@pytest.mark.asyncio
+async def test_get_job_result_sync_jitter(
+    node: NodeClient, mock_sleep: AsyncMock
+) -> None:
+    """Test that get_job_result_sync randomly varies its poll intervals, within the
+    same total wait."""
+
+    with patch.object(
+        node,
+        "get_job_results",
+        new=AsyncMock(side_effect=get_job_results_side_effect(100)),
+    ):
+        with pytest.raises(TimeoutError):
+            await node.get_job_result_sync("some-job", retries=5)
 
-        # Get job results
-        results = await node.get_job_results(job_ids)
+        delays = [args[0] for args, _ in mock_sleep.await_args_list]
+        for delay, interval in zip(delays, [0.05, 0.1, 0.2, 0.4, 0.8]):
+            assert interval * 0.8 <= delay <= interval * 1.2
+        assert sum(delays) == pytest.approx(5)
+
+
+@pytest.mark.asyncio
+async def test_get_job_results_sync(node: NodeClient) -> None:
+    """Test that get_job_results_sync only polls for running jobs, and returns
+    results in the order of the given job IDs."""
+
+    statuses = {
+        "a": ["running", "success"],
+        "b": ["failed"],
+        "c": ["running", "running", "success"],
+    }
+
+    def side_effect(job_ids: list[str], **kwargs: Any) -> list[dict[str, Any]]:
+        return [{"id": i, "status": statuses[i].pop(0)} for i in job_ids if i != "d"]
+
+    with patch.object(
+        node, "get_job_results", new=AsyncMock(side_effect=side_effect)
+    ) as mock_get_job_results:
+        results = await node.get_job_results_sync(["c", "d", "b", "a"], retries=5)
+
+        assert [r and r["status"] for r in results] == [
+            "success",
+            None,
+            "failed",
+            "success",
+        ]
+        assert [r and r["id"] for r in results] == ["c", None, "b", "a"]
+        polled = [sorted(args[0]) for args, _ in mock_get_job_results.await_args_list]
+        assert polled == [["a", "b", "c", "d"], ["a", "c"], ["c"]]
+
+
+@pytest.mark.asyncio
+async def test_get_job_results_sync_timeout(node: NodeClient) -> None:
+    """Test that get_job_results_sync raises a TimeoutError if any job is still
+    running after enough retries."""
+
+    def side_effect(job_ids: list[str], **kwargs: Any) -> list[dict[str, Any]]:
+        return [
+            {"id": i, "status": "running" if i == "a" else "success"} for i in job_ids
+        ]
+
+    with patch.object(node, "get_job_results", new=AsyncMock(side_effect=side_effect)):
+        with pytest.raises(TimeoutError) as exc_info:
+            await node.get_job_results_sync(["a", "b"], retries=5)
 
-        assert len(results) == 3
         assert (
-            mock_get.call_args[0][0]
-            == f"{node.base_url}/api/jobs?id={'&id='.join(job_ids)}"
-        )
-        assert all(
-            cast(JobResponse, {"id": job_id, **job_request_result}) in results
-            for job_id in job_ids
+            exc_info.value.args[0] == "Results of 1 jobs not available after 5 retries"
         )
 
 
 @pytest.mark.asyncio
-@pytest.mark.usefixtures("node")
-async def test_get_job_results_with_intermediate(node: NodeClient) -> None:
+async def test_get_job_results(node: NodeClient, http_mocks: SimpleNamespace) -> None:
+    """Test that get_job_results returns job results."""
+
+    job_ids = [str(uuid4()) for _ in range(3)]
+    mock_get = http_mocks.get
+    expected = [{"id": job_id, **job_request_result} for job_id in job_ids]
+    bind_response(mock_get, create_json_response(expected))
+
+    # Get job results
+    results = await node.get_job_results(job_ids)
+
+    assert mock_get.call_args[0][0] == f"{node.base_url}/api/jobs"
+    assert mock_get.call_args[1]["params"] == [("id", job_id) for job_id in job_ids]
+    assert results == expected
+
+
+@pytest.mark.asyncio
+async def test_get_job_results_with_intermediate(
+    node: NodeClient, http_mocks: SimpleNamespace
+) -> None:
     """Test that get_job_results returns intermediate results when requested."""
 
     job_ids = [str(uuid4()) for _ in range(3)]
-    with patch("aiohttp.ClientSession.get") as mock_get:
-        mock_response = Mock()
-        mock_response.json = AsyncMock(
-            return_value=[{"id": job_id, **job_request_result} for job_id in job_ids]
-        )
-        mock_get.return_value.__aenter__.return_value = mock_response
+    mock_get = http_mocks.get
+    expected = [{"id": job_id, **job_request_result} for job_id in job_ids]
+    bind_response(mock_get, create_json_response(expected))
 
-        # Get job results with intermediate results
-        results = await node.get_job_results(job_ids, intermediate=True)
+    # Get job results with intermediate results
+    results = await node.get_job_results(job_ids, intermediate=True)
 
-        assert len(results) == 3
-        assert (
-            mock_get.call_args[0][0]
-            == f"{node.base_url}/api/jobs?id={'&id='.join(job_ids)}&intermediate=true"
-        )
-        assert all(
-            cast(JobResponse, {"id": job_id, **job_request_result}) in results
-            for job_id in job_ids
+    assert mock_get.call_args[0][0] == f"{node.base_url}/api/jobs"
+    assert mock_get.call_args[1]["params"] == [
+        *[("id", job_id) for job_id in job_ids],
+        ("intermediate", "true"),
+    ]
+    assert results == expected
+
+
+@pytest.mark.asyncio
+async def test_get_job_results_batched(
+    node: NodeClient, http_mocks: SimpleNamespace
+) -> None:
+    """Test that get_job_results splits many job IDs into batched requests, and
+    returns the results in order."""
+
+    job_ids = [str(uuid4()) for _ in range(250)]
+
+    def _get(url: str, params: list[tuple[str, str]], **_: Any) -> MagicMock:
+        ids = [value for _, value in params]
+        mock_response = create_json_response(
+            [{"id": job_id, **job_request_result} for job_id in ids]
         )
+        mock = MagicMock()
+        mock.__aenter__.return_value = mock_response
+        return mock
+
+    mock_get = http_mocks.get
+    mock_get.side_effect = _get
+    results = await node.get_job_results(job_ids)
+
+    assert mock_get.call_count == 3
+    assert [result["id"] for result in results] == job_ids
 
 
 @pytest.mark.asyncio
-@pytest.mark.usefixtures("node")
-async def test_get_jobs(node: NodeClient) -> None:
+async def test_get_jobs(node: NodeClient, http_mocks: SimpleNamespace) -> None:
     """Test that get_jobs returns job IDs."""
 
     job_ids = [str(uuid4()) for _ in range(3)]
-    with patch("aiohttp.ClientSession.get") as mock_get:
-        mock_response = Mock()
-        mock_response.json = AsyncMock(return_value=job_ids)
-        mock_get.return_value.__aenter__.return_value = mock_response
+    mock_get = http_mocks.get
+    mock_response = create_json_response(job_ids)
+    bind_response(mock_get, mock_response)
 
-        # Get job IDs
-        job_ids = await node.get_jobs()
+    # Get job IDs
+    job_ids = await node.get_jobs()
 
-        assert len(job_ids) == 3
-        assert mock_get.call_args[0][0] == f"{node.base_url}/api/jobs"
+    assert len(job_ids) == 3
+    assert mock_get.call_args[0][0] == f"{node.base_url}/api/jobs"
 
 
 @pytest.mark.asyncio
-@pytest.mark.usefixtures("node")
-async def test_get_jobs_pending(node: NodeClient) -> None:
+async def test_get_jobs_pending(node: NodeClient, http_mocks: SimpleNamespace) -> None:
     """Test that get_jobs returns pending job IDs."""
 
     job_ids = [str(uuid4()) for _ in range(3)]
-    with patch("aiohttp.ClientSession.get") as mock_get:
-        mock_response = Mock()
-        mock_response.json = AsyncMock(return_value=job_ids)
-        mock_get.return_value.__aenter__.return_value = mock_response
+    mock_get = http_mocks.get
+    mock_response = create_json_response(job_ids)
+    bind_response(mock_get, mock_response)
 
-        # Get job IDs
-        job_ids = await node.get_jobs(pending=True)
+    # Get job IDs
+    job_ids = await node.get_jobs(pending=True)
 
-        assert len(job_ids) == 3
-        assert mock_get.call_args[0][0] == f"{node.base_url}/api/jobs?pending=true"
+    assert len(job_ids) == 3
+    assert mock_get.call_args[0][0] == f"{node.base_url}/api/jobs?pending=true"
 
 
 @pytest.mark.asyncio
-@pytest.mark.usefixtures("node")
-async def test_streamed_response(node: NodeClient) -> None:
+async def test_streamed_response(node: NodeClient, http_mocks: SimpleNamespace) -> None:
     """Test that the client can handle streamed responses."""
 
     # Mock data that would be streamed by the server
@@ -507,132 +646,113 @@ async def test_streamed_response(node: NodeClient) -> None:
     ]
     mock_response = create_mock_response(chunks)
 
-    with patch("aiohttp.ClientSession.post") as mock_post:
-        mock_post.return_value.__aenter__.return_value = mock_response
-        # Collect the results from the generator
-        results: list[str] = []
-        job_id = None
-        async for chunk in node.request_stream(job_request_streamed):
-            if not job_id:
-                job_id = chunk
-            else:
-                results.append(chunk.decode("utf-8").strip())
-
-        # Assertions to check if the streamed data is processed correctly
-        assert job_id == "123456789"
-        assert results == ["some data", "more data", "final data"]
-        assert mock_post.call_args[0][0] == f"{node.base_url}/api/jobs/stream"
-
-
-@pytest.mark.asyncio
-@pytest.mark.usefixtures("node")
-async def test_request_stream_nonexistent_container(node: NodeClient) -> None:
-    """Test that request_stream raises an exception when container not supported."""
-
-    mock_response = create_mock_response(
-        [],
-        status=405,
-        error={
-            "error": "Container not supported",
-            "params": {"container": "non-existent"},
-        },
-    )
-
-    with patch("aiohttp.ClientSession.post") as mock_post:
-        mock_post.return_value.__aenter__.return_value = mock_response
-        with pytest.raises(APIError) as exc_info:
-            async for _ in node.request_stream(job_request_nonexistent):
-                pass
+    mock_post = http_mocks.post
+    bind_response(mock_post, mock_response)
+    # Collect the results from the generator
+    results: list[str] = []
+    job_id = None
+    async for chunk in node.request_stream(job_request_streamed):
+        if not job_id:
+            job_id = chunk
+        else:
+            results.append(chunk.decode("utf-8").strip())
 
-        assert mock_post.call_args[0][0] == f"{node.base_url}/api/jobs/stream"
-        assert exc_info.value.status_code == 405
-        assert exc_info.value.message == "Container not supported"
-        assert exc_info.value.params == {"container": "non-existent"}
+    # Assertions to check if the streamed data is processed correctly
+    assert job_id == "123456789"
+    assert results == ["some data", "more data", "final data"]
+    assert mock_post.call_args[0][0] == f"{node.base_url}/api/jobs/stream"
 
 
 @pytest.mark.asyncio
-@pytest.mark.usefixtures("node")
-async def test_request_stream_malformed(node: NodeClient) -> None:
-    """Test that request_stream raises an exception when request body is malformed."""
+@pytest.mark.parametrize(
+    "status, error",
+    [
+        (
+            405,
+            {
+                "error": "Container not supported",
+                "params": {"container": "non-existent"},
+            },
+        ),
+        (500, {"error": 'Internal server error: missing value for field "data"'}),
+    ],
+    ids=["nonexistent_container", "malformed"],
+)
+async def test_request_stream_error(
+    node: NodeClient, http_mocks: SimpleNamespace, status: int, error: dict[str, Any]
+) -> None:
+    """Test that request_stream raises the server's error when the request fails."""
 
-    mock_response = create_mock_response(
-        [],
-        status=500,
-        error={"error": 'Internal server error: missing value for field "data"'},
-    )
+    mock_response = create_mock_response([], status=status, error=error)
 
-    with patch("aiohttp.ClientSession.post") as mock_post:
-        mock_post.return_value.__aenter__.return_value = mock_response
-        with pytest.raises(APIError) as exc_info:
-            async for _ in node.request_stream(job_request_nonexistent):
-                pass
+    mock_post = http_mocks.post
+    bind_response(mock_post, mock_response)
+    with pytest.raises(APIError) as exc_info:
+        async for _ in node.request_stream(job_request_nonexistent):
+            pass
 
-        assert mock_post.call_args[0][0] == f"{node.base_url}/api/jobs/stream"
-        assert exc_info.value.status_code == 500
-        assert (
-            exc_info.value.message
-            == 'Internal server error: missing value for field "data"'
-        )
+    assert mock_post.call_args[0][0] == f"{node.base_url}/api/jobs/stream"
+    assert exc_info.value.status_code == status
+    assert exc_info.value.message == error["error"]
+    assert exc_info.value.params == error.get("params", {})
 
 
 @pytest.mark.asyncio
-@pytest.mark.usefixtures("node")
-async def test_record_status(node: NodeClient) -> None:
+async def test_record_status(node: NodeClient, http_mocks: SimpleNamespace) -> None:
     """Test that record_status records the status of a job."""
 
     job_id = str(uuid4())
-    mock_response = Mock()
-    mock_response.json = AsyncMock()
+    mock_response = create_json_response()
 
-    with patch("aiohttp.ClientSession.put") as mock_put:
-        mock_put.return_value.__aenter__.return_value = mock_response
+    mock_put = http_mocks.put
+    bind_response(mock_put, mock_response)
 
-        # Record status
-        await node.record_status(
-            job_id,
-            "success",
-            {"containers": ["test-container"], "data": {"some": "data"}},
-        )
+    # Record status
+    await node.record_status(
+        job_id,
+        "success",
+        {"containers": ["test-container"], "data": {"some": "data"}},
+    )
 
-        assert mock_put.call_args[0][0] == f"{node.base_url}/api/status"
-        assert mock_put.call_args[1]["json"] == {
-            "id": job_id,
-            "status": "success",
-            "containers": ["test-container"],
-            "data": {"some": "data"},
-        }
+    assert mock_put.call_args[0][0] == f"{node.base_url}/api/status"
+    assert mock_put.call_args[1]["json"] == {
+        "id": job_id,
+        "status": "success",
+        "containers": ["test-container"],
+        "data": {"some": "data"},
+    }
 
 
 @pytest.mark.asyncio
-@pytest.mark.usefixtures("node")
 @pytest.mark.parametrize(
     "error_response",
     [(400, "")],
     indirect=True,
 )
 async def test_record_status_failed(
-    node: NodeClient, error_response: MagicMock
+    node: NodeClient, error_response: MagicMock, http_mocks: SimpleNamespace
 ) -> None:
     """Test that record_status raises an exception when an error occurs"""
 
     job_id = str(uuid4())
     error_message = "Status is invalid"
 
-    with patch("aiohttp.ClientSession.put") as mock_put:
-        error_response.json = AsyncMock(return_value={"error": error_message})
-        mock_put.return_value.__aenter__.return_value = error_response
+    mock_put = http_mocks.put
+    error_response.json = AsyncMock(return_value={"error": error_message})
+    bind_response(mock_put, error_response)
 
-        with pytest.raises(APIError) as exc_info:
-            await node.record_status(job_id, "invalid", {})  # type: ignore
+    with pytest.raises(APIError) as exc_info:
+        await node.record_status(job_id, "invalid", {})  # type: ignore
 
-        assert exc_info.value.status_code == 400
-        assert exc_info.value.message == error_message
-        assert mock_put.call_args[0][0] == f"{node.base_url}/api/status"
+    assert exc_info.value.status_code == 400
+    assert exc_info.value.message == error_message
+    assert mock_put.call_args[0][0] == f"{node.base_url}/api/status"
 
 
 @pytest.mark.asyncio
-@pytest.mark.usefixtures("node")
-async def test_request_delegated_subscription(node: NodeClient) -> None:
+async def test_request_delegated_subscription(
+    node: NodeClient, http_mocks: SimpleNamespace
+) -> None:
     """Test that request_delegated_subscription calls the correct endpoint."""
 
     (
@@ -649,20 +769,18 @@ async def test_request_delegated_subscription(node: NodeClient) -> None:
     rpc.get_checksum_address = Mock(return_value=coordinator)
     rpc.get_chain_id = AsyncMock(return_value=chain_id)
 
-    with patch("aiohttp.ClientSession.post") as mock_post:
-        mock_post.return_value.__aenter__.return_value = Mock()
-        mock_post.return_value.__aenter__.return_value.json = AsyncMock()
-        mock_post.return_value.__aenter__.return_value.raise_for_status = Mock()
+    mock_post = http_mocks.post
+    bind_response(mock_post, create_json_response())
 
-        await node.request_delegated_subscription(
-            sub,
-            rpc,
-            ChecksumAddress(HexAddress(HexStr(sub.owner))),
-            expiry,
-            nonce,
-            private_key,
-            input_data,
-        )
+    await node.request_delegated_subscription(
+        sub,
+        rpc,
+        ChecksumAddress(HexAddress(HexStr(sub.owner))),
+        expiry,
+        nonce,
+        private_key,
+        input_data,
+    )
 
     assert mock_post.call_args[0][0] == f"{node.base_url}/api/jobs"
     assert mock_post.call_args[1]["json"]["signature"]["nonce"] == nonce
@@ -674,9 +792,32 @@ async def test_request_delegated_subscription(node: NodeClient) -> None:
     assert mock_post.call_args[1]["json"]["data"] == input_data
 
 
+def test_signing_key() -> None:
+    """Test that signing keys are parsed once per client, sign as the raw private key
+    does, and are dropped with the client's cache."""
+
+    from eth_account import Account
+    from eth_account.messages import encode_defunct
+
+    node = NodeClient("http://127.0.0.1:4000")
+    private_key = get_subscription_params()[4]
+    message = encode_defunct(text="infernet")
+
+    key = node._signing_key(private_key)
+    assert node._signing_key(private_key) is key
+    assert NodeClient("http://127.0.0.1:4000")._signing_key(private_key) is not key
+    assert Account.sign_message(message, key) == Account.sign_message(
+        message, private_key
+    )
+
+    node.clear_cache()
+    assert not node._signing_keys
+
+
 @pytest.mark.asyncio
-@pytest.mark.usefixtures("node")
-async def test_request_delegated_subscription_nonexistent(node: NodeClient) -> None:
+async def test_request_delegated_subscription_nonexistent(
+    node: NodeClient, http_mocks: SimpleNamespace
+) -> None:
     """Test that request_delegated_subscription raises an exception"""
 
     (
@@ -711,68 +852,57 @@ async def test_request_delegated_subscription_nonexistent(node: NodeClient) -> N
         return_value={"error": error_message, "params": error_params}
     )
 
-    with patch("aiohttp.ClientSession.post") as mock_post:
-        mock_post.return_value.__aenter__.return_value = mock_response
-
-        with pytest.raises(APIError) as exc_info:
-            await node.request_delegated_subscription(
-                sub,
-                rpc,
-                ChecksumAddress(HexAddress(HexStr(sub.owner))),
-                expiry,
-                nonce,
-                private_key,
-                input_data,
-            )
-        assert exc_info.value.status_code == error_status
-        assert exc_info.value.message == error_message
-        assert exc_info.value.params == error_params
+    mock_post = http_mocks.post
+    bind_response(mock_post, mock_response)
+
+    with pytest.raises(APIError) as exc_info:
+        await node.request_delegated_subscription(
+            sub,
+            rpc,
+            ChecksumAddress(HexAddress(HexStr(sub.owner))),
+            expiry,
+            nonce,
+            private_key,
+            input_data,
+        )
+    assert exc_info.value.status_code == error_status
+    assert exc_info.value.message == error_message
+    assert exc_info.value.params == error_params
 
 
 @pytest.mark.asyncio
-@pytest.mark.usefixtures("router")
-async def test_containers(router: RouterClient) -> None:
+async def test_containers(router: RouterClient, http_mocks: SimpleNamespace) -> None:
     """Test that get_containers returns the list of containers."""
 
-    mock_containers = [
-        {"id": "hello-world", "count": 100, "description": "Hello World container"},
-        {
-            "id": "ritual-tgi-inference",
-            "count": 3,
-            "description": "Serving meta-llama/Llama-2-7b-chat-hf via TGI",
-        },
-    ]
-
-    with patch("aiohttp.ClientSession.get") as mock_get:
-        mock_response = Mock()
-        mock_response.json = AsyncMock(return_value=mock_containers)
-        mock_get.return_value.__aenter__.return_value = mock_response
+    mock_get = http_mocks.get
+    mock_response = create_json_response(mock_containers)
+    bind_response(mock_get, mock_response)
 
-        assert (
-            cast(list[dict[str, object]], await router.get_containers())
-            == mock_containers
-        )
-        assert mock_get.call_args[0][0] == f"{router.base_url}/api/v1/containers"
+    assert (
+        cast(list[dict[str, object]], await router.get_containers()) == mock_containers
+    )
+    assert mock_get.call_args[0][0] == f"{router.base_url}/api/v1/containers"
 
 
 @pytest.mark.asyncio
-@pytest.mark.usefixtures("router")
-async def test_get_nodes_by_container_ids(router: RouterClient) -> None:
+async def test_get_nodes_by_container_ids(
+    router: RouterClient, http_mocks: SimpleNamespace
+) -> None:
     """Test that get_nodes_by_container_ids returns a list of nodes."""
 
-    mock_nodes = ["167.86.78.186:4000", "84.54.13.11:4000", "37.27.106.57:4000"]
     ids = ["c1", "c2"]
     n = 5
     offset = 3
 
-    with patch("aiohttp.ClientSession.get") as mock_get:
-        mock_response = Mock()
-        mock_response.json = AsyncMock(return_value=mock_nodes)
-        mock_get.return_value.__aenter__.return_value = mock_response
-
-        assert await router.get_nodes_by_container_ids(ids, n, offset) == mock_nodes
-        assert mock_get.call_args[0][0] == (
-            f"{router.base_url}/api/v1/ips?"
-            f"{'&'.join([f'container={id}' for id in ids])}"
-            f"&n={n}&offset={offset}"
-        )
+    mock_get = http_mocks.get
+    mock_response = create_json_response(mock_nodes)
+    bind_response(mock_get, mock_response)
+
+    assert await router.get_nodes_by_container_ids(ids, n, offset) == mock_nodes
+    assert mock_get.call_args[0][0] == f"{router.base_url}/api/v1/ips"
+    assert mock_get.call_args[1]["params"] == [
+        ("container", "c1"),
+        ("container", "c2"),
+        ("n", "5"),
+        ("offset", "3"),
+    ]